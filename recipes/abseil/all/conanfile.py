@@ -26,10 +26,21 @@ class AbseilConan(ConanFile):
     options = {
         "shared": [True, False],
         "fPIC": [True, False],
+        "hardened": [True, False],
+        "std_types": ["auto", "std", "absl"],
+        "sse42_aes": [True, False],
     }
     default_options = {
         "shared": False,
         "fPIC": True,
+        "hardened": False,
+        "std_types": "auto",
+        "sse42_aes": False,
+    }
+    options_description = {
+        "hardened": "Enable ABSL_OPTION_HARDENED, trading speed for extra runtime checks",
+        "std_types": "Pin ABSL_OPTION_USE_STD_* instead of detecting them: 'std' aliases absl types to their std counterparts, 'absl' always uses absl implementations",
+        "sse42_aes": "Build with -msse4.2, -mpclmul and -maes so hashing, CRC32C and randen use hardware instructions (propagated to consumers)",
     }
     short_paths = True
 
@@ -53,9 +64,17 @@ class AbseilConan(ConanFile):
         copy(self, "abi_trick/*", self.recipe_folder, self.export_sources_folder)
         export_conandata_patches(self)
 
+    @property
+    def _isa_flags(self):
+        return ["-msse4.2", "-mpclmul", "-maes"] if self.options.get_safe("sse42_aes") else []
+
     def config_options(self):
         if self.settings.os == "Windows":
             del self.options.fPIC
+        if Version(self.version) < "20230125.0":
+            del self.options.hardened
+        if self.settings.arch not in ["x86", "x86_64"] or is_msvc(self):
+            del self.options.sse42_aes
 
     def configure(self):
         if self.options.shared:
@@ -74,6 +93,9 @@ class AbseilConan(ConanFile):
             # upstream tries its best to export symbols, but it's broken for the moment
             raise ConanInvalidConfiguration(f"{self.ref} shared not availabe for Visual Studio, please use version 20230802.1 or newer")
 
+        if self.options.std_types == "std":
+            check_min_cppstd(self, 17)
+
     def build_requirements(self):
         # https://github.com/abseil/abseil-cpp/blob/20240722.0/CMakeLists.txt#L19
         if Version(self.version) >= "20240722.0":
@@ -95,6 +117,7 @@ class AbseilConan(ConanFile):
         if is_msvc(self):
             # see https://github.com/abseil/abseil-cpp/issues/649
             tc.preprocessor_definitions["_HAS_DEPRECATED_RESULT_OF"] = 1
+        tc.extra_cxxflags.extend(self._isa_flags)
         tc.generate()
 
     def _patch_sources(self):
@@ -123,7 +146,12 @@ class AbseilConan(ConanFile):
         cmake = CMake(self)
         cmake.configure()
         abi_file = _ABIFile(self, os.path.join(self.build_folder, "abi.h"))
-        abi_file.replace_in_options_file(os.path.join(self.source_folder, "absl", "base", "options.h"))
+        if self.options.std_types != "auto":
+            abi_file.force(self.options.std_types == "std")
+        options_file = os.path.join(self.source_folder, "absl", "base", "options.h")
+        abi_file.replace_in_options_file(options_file)
+        if self.options.get_safe("hardened"):
+            replace_in_file(self, options_file, "#define ABSL_OPTION_HARDENED 0", "#define ABSL_OPTION_HARDENED 1")
         cmake.build()
 
     def package(self):
@@ -247,6 +275,8 @@ class AbseilConan(ConanFile):
         self.cpp_info.set_property("cmake_build_modules", [self._cxx_std_module_filepath])
         self.cpp_info.components["absl_config"].build_modules["cmake_find_package"] = [self._cxx_std_module_filepath]
         self.cpp_info.components["absl_config"].build_modules["cmake_find_package_multi"] = [self._cxx_std_module_filepath]
+        # inline hashing and CRC code must see the same ISA as the compiled library
+        self.cpp_info.components["absl_config"].cxxflags = self._isa_flags
 
 
 class _ABIFile:
@@ -267,5 +297,10 @@ class _ABIFile:
                     "#define ABSL_OPTION_{} 2".format(name),
                     "#define ABSL_OPTION_{} {}".format(name, value))
 
+    def force(self, use_std):
+        # Only affects the USE_STD_* entries detected by abi_trick, so they are all pinned together
+        for name in self.abi:
+            self.abi[name] = "1" if use_std else "0"
+
     def cxx_std(self):
         return 17 if any([v == "1" for k, v in self.abi.items()]) else 11
@@ -2,12 +2,13 @@ from conan import ConanFile
 from conan.errors import ConanInvalidConfiguration, ConanException
 from conan.tools.build import check_min_cppstd, cross_building
 from conan.tools.cmake import CMake, CMakeDeps, CMakeToolchain, cmake_layout
-from conan.tools.files import apply_conandata_patches, copy, export_conandata_patches, get, rmdir, save, replace_in_file
+from conan.tools.files import apply_conandata_patches, copy, export_conandata_patches, get, load, rmdir, save, replace_in_file
 from conan.tools.microsoft import is_msvc, is_msvc_static_runtime
 from conan.tools.scm import Version
 
 import os
 import glob
+import re
 import textwrap
 
 required_conan_version = ">=1.53.0"
@@ -39,6 +40,9 @@ class ArrowConan(ConanFile):
         "plasma": [True, False, "deprecated"],
         "simd_level": [None, "default", "sse4_2", "avx2", "avx512", "neon", ],
         "runtime_simd_level": [None, "sse4_2", "avx2", "avx512", "max"],
+        "default_memory_pool": [None, "system", "jemalloc", "mimalloc"],
+        "io_threads": [None, "ANY"],
+        "parquet_read_optimizations": [True, False],
         "with_backtrace": [True, False],
         "with_boost": ["auto", True, False],
         "with_csv": [True, False],
@@ -86,6 +90,9 @@ class ArrowConan(ConanFile):
         "plasma": "deprecated",
         "simd_level": "default",
         "runtime_simd_level": "max",
+        "default_memory_pool": None,
+        "io_threads": None,
+        "parquet_read_optimizations": False,
         "with_backtrace": False,
         "with_boost": True,
         "with_brotli": False,
@@ -115,6 +122,15 @@ class ArrowConan(ConanFile):
         "with_zlib": True,
         "with_zstd": False,
     }
+    options_description = {
+        "runtime_simd_level": "Highest SIMD level kernels are dispatched to at runtime (x86 only)",
+        "default_memory_pool": "Backend of arrow::default_memory_pool() built into the library, ARROW_DEFAULT_MEMORY_POOL "
+                               "still overrides it at runtime. If None, arrow picks jemalloc, then mimalloc, then the system allocator",
+        "io_threads": "Default capacity of the IO thread pool built into the library (arrow default: 8), "
+                      "ARROW_IO_THREADS still overrides it at runtime",
+        "parquet_read_optimizations": "Enable parquet, datasets, the snappy/lz4/zstd/zlib codecs, SIMD, re2 and utf8proc "
+                                      "for fast parquet scans, without parquet encryption",
+    }
     short_paths = True
 
     @property
@@ -149,11 +165,27 @@ class ArrowConan(ConanFile):
             del self.options.substrait
         if is_msvc(self):
             self.options.with_boost = True
+        if self.settings.arch not in ["x86", "x86_64"]:
+            # ARROW_RUNTIME_SIMD_LEVEL is ignored by arrow outside of x86
+            del self.options.runtime_simd_level
+
+    @property
+    def _parquet_read_optimizations_options(self):
+        return ["parquet", "with_thrift", "with_boost", "compute", "acero", "dataset_modules", "filesystem_layer",
+                "with_snappy", "with_lz4", "with_zstd", "with_zlib", "with_re2", "with_utf8proc"]
 
     def configure(self):
         if self.options.shared:
             self.options.rm_safe("fPIC")
 
+        if self.options.parquet_read_optimizations:
+            # Only enable options left at their default, explicit opt-outs are rejected in validate()
+            for option in self._parquet_read_optimizations_options:
+                if self.options.get_safe(option) == self.default_options[option]:
+                    setattr(self.options, option, True)
+            if self.options.simd_level == None:
+                self.options.simd_level = "default"
+
     def layout(self):
         cmake_layout(self, src_folder="src")
 
@@ -260,6 +292,21 @@ class ArrowConan(ConanFile):
         if self.options.with_s3 and not self.dependencies["aws-sdk-cpp"].options.config:
             raise ConanInvalidConfiguration("arrow:with_s3 requires aws-sdk-cpp:config is True.")
 
+        if self.options.io_threads and (not str(self.options.io_threads).isdigit() or int(self.options.io_threads) == 0):
+            raise ConanInvalidConfiguration("arrow:io_threads must be a positive number of threads")
+
+        if self.options.parquet_read_optimizations:
+            if self.options.encryption:
+                raise ConanInvalidConfiguration("arrow:parquet_read_optimizations can't be used with arrow:encryption")
+            disabled = [option for option in self._parquet_read_optimizations_options if not self.options.get_safe(option)]
+            if disabled:
+                raise ConanInvalidConfiguration("arrow:parquet_read_optimizations requires " +
+                                                ", ".join(f"arrow:{option}=True" for option in disabled))
+
+        if self.options.default_memory_pool in ["jemalloc", "mimalloc"] and \
+           not self.options.get_safe(f"with_{self.options.default_memory_pool}"):
+            raise ConanInvalidConfiguration(f"arrow:default_memory_pool={self.options.default_memory_pool} requires arrow:with_{self.options.default_memory_pool}")
+
         if self.options.shared and self.options.with_jemalloc:
             if self.dependencies["jemalloc"].options.enable_cxx:
                 raise ConanInvalidConfiguration("jemmalloc.enable_cxx of a static jemalloc must be disabled")
@@ -353,7 +400,7 @@ class ArrowConan(ConanFile):
         tc.variables["ARROW_WITH_ZSTD"] = bool(self.options.with_zstd)
         tc.variables["zstd_SOURCE"] = "SYSTEM"
         tc.variables["ARROW_SIMD_LEVEL"] = str(self.options.simd_level).upper()
-        tc.variables["ARROW_RUNTIME_SIMD_LEVEL"] = str(self.options.runtime_simd_level).upper()
+        tc.variables["ARROW_RUNTIME_SIMD_LEVEL"] = str(self.options.get_safe("runtime_simd_level")).upper()
         if self.options.with_zstd:
             tc.variables["ARROW_ZSTD_USE_SHARED"] = bool(self.dependencies["zstd"].options.shared)
         tc.variables["ORC_SOURCE"] = "SYSTEM"
@@ -418,6 +465,31 @@ class ArrowConan(ConanFile):
                     "FindParquet.cmake",
                 ]:
                     os.remove(filename)
+        self._patch_default_memory_pool()
+        self._patch_io_threads()
+
+    def _patch_default_memory_pool(self):
+        backend = self.options.default_memory_pool
+        if not backend:
+            return
+        # kDefaultBackend is declared once per ARROW_JEMALLOC/ARROW_MIMALLOC branch
+        memory_pool_cc = os.path.join(self.source_folder, "cpp", "src", "arrow", "memory_pool.cc")
+        content, count = re.subn(r"(constexpr MemoryPoolBackend kDefaultBackend\s*=\s*)MemoryPoolBackend::\w+;",
+                                 rf"\g<1>MemoryPoolBackend::{str(backend).capitalize()};", load(self, memory_pool_cc))
+        if count == 0:
+            raise ConanException(f"Could not find kDefaultBackend in {memory_pool_cc}")
+        save(self, memory_pool_cc, content)
+
+    def _patch_io_threads(self):
+        io_threads = self.options.io_threads
+        if not io_threads:
+            return
+        interfaces_cc = os.path.join(self.source_folder, "cpp", "src", "arrow", "io", "interfaces.cc")
+        content, count = re.subn(r"(constexpr int k\w*I[Oo]\w*Threads\s*=\s*)\d+;",
+                                 rf"\g<1>{io_threads};", load(self, interfaces_cc))
+        if count != 1:
+            raise ConanException(f"Could not find the default number of IO threads in {interfaces_cc}")
+        save(self, interfaces_cc, content)
 
     def build(self):
         self._patch_sources()
@@ -15,11 +15,28 @@
 // specific language governing permissions and limitations
 // under the License.
 
+#include <chrono>
 #include <cstdint>
 #include <iostream>
 #include <vector>
 
 #include <arrow/api.h>
+#include <arrow/util/config.h>
+#ifdef ARROW_COMPUTE
+#include <arrow/compute/api.h>
+#endif
+#ifdef ARROW_ACERO
+#include <arrow/acero/exec_plan.h>
+#include <arrow/acero/options.h>
+#endif
+#if defined(ARROW_DATASET) && defined(ARROW_PARQUET) && ARROW_VERSION_MAJOR >= 10
+#define TEST_PACKAGE_DATASET_SCAN
+#include <filesystem>
+#include <arrow/dataset/api.h>
+#include <arrow/filesystem/api.h>
+#include <arrow/util/compression.h>
+#include <parquet/arrow/writer.h>
+#endif
 
 using arrow::DoubleBuilder;
 using arrow::Int64Builder;
@@ -165,6 +182,106 @@ arrow::Status ColumnarTableToVector(const std::shared_ptr<arrow::Table>& table,
   return arrow::Status::OK();
 }
 
+#ifdef ARROW_COMPUTE
+// Time compute kernels on the default memory pool, so the effect of the
+// default_memory_pool and runtime_simd_level options can be compared.
+template <typename Function>
+arrow::Status Measure(const char* name, Function&& function) {
+  const auto start = std::chrono::steady_clock::now();
+  ARROW_RETURN_NOT_OK(function());
+  const std::chrono::duration<double, std::milli> elapsed =
+      std::chrono::steady_clock::now() - start;
+  std::cout << name << ": " << elapsed.count() << " ms" << std::endl;
+  return arrow::Status::OK();
+}
+
+arrow::Result<std::shared_ptr<arrow::Array>> MakeInt64Array(int64_t length, int64_t modulo) {
+  Int64Builder builder(arrow::default_memory_pool());
+  ARROW_RETURN_NOT_OK(builder.Reserve(length));
+  uint64_t seed = 42;
+  for (int64_t i = 0; i < length; ++i) {
+    seed = seed * 6364136223846793005ULL + 1442695040888963407ULL;
+    builder.UnsafeAppend(static_cast<int64_t>((seed >> 33) % modulo));
+  }
+  return builder.Finish();
+}
+
+arrow::Status BenchmarkCompute() {
+  constexpr int64_t kLength = 1 << 22;
+  std::cout << "Memory pool: " << arrow::default_memory_pool()->backend_name() << std::endl;
+
+  ARROW_ASSIGN_OR_RAISE(auto values, MakeInt64Array(kLength, 1000));
+
+  ARROW_RETURN_NOT_OK(Measure("sum", [&]() -> arrow::Status {
+    ARROW_ASSIGN_OR_RAISE(auto sum, arrow::compute::Sum(values));
+    return sum.scalar()->is_valid ? arrow::Status::OK() : arrow::Status::Invalid("null sum");
+  }));
+
+  ARROW_RETURN_NOT_OK(Measure("filter", [&]() -> arrow::Status {
+    ARROW_ASSIGN_OR_RAISE(auto mask, arrow::compute::CallFunction(
+                                         "greater", {values, arrow::Datum(int64_t{500})}));
+    ARROW_ASSIGN_OR_RAISE(auto filtered, arrow::compute::Filter(values, mask));
+    return filtered.length() > 0 ? arrow::Status::OK() : arrow::Status::Invalid("empty filter");
+  }));
+
+#ifdef ARROW_ACERO
+  ARROW_ASSIGN_OR_RAISE(auto right_keys, MakeInt64Array(kLength / 16, 1000));
+  auto schema = arrow::schema({arrow::field("key", arrow::int64())});
+  auto left = arrow::Table::Make(schema, {values});
+  auto right = arrow::Table::Make(schema, {right_keys});
+
+  ARROW_RETURN_NOT_OK(Measure("hash join", [&]() -> arrow::Status {
+    arrow::acero::Declaration join{
+        "hashjoin",
+        {arrow::acero::Declaration{"table_source", arrow::acero::TableSourceNodeOptions{left}},
+         arrow::acero::Declaration{"table_source", arrow::acero::TableSourceNodeOptions{right}}},
+        arrow::acero::HashJoinNodeOptions{arrow::acero::JoinType::LEFT_SEMI, {"key"}, {"key"}}};
+    ARROW_ASSIGN_OR_RAISE(auto joined, arrow::acero::DeclarationToTable(std::move(join)));
+    return joined->num_rows() > 0 ? arrow::Status::OK() : arrow::Status::Invalid("empty join");
+  }));
+#endif
+
+  return arrow::Status::OK();
+}
+#endif
+
+#ifdef TEST_PACKAGE_DATASET_SCAN
+// Write a parquet file and scan it back through the dataset API with a
+// pushed-down filter, which exercises the IO thread pool and the parquet reader.
+arrow::Status BenchmarkDatasetScan() {
+  constexpr int64_t kLength = 1 << 22;
+  const std::string path = std::filesystem::absolute("test_package.parquet").string();
+  auto fs = std::make_shared<arrow::fs::LocalFileSystem>();
+
+  ARROW_ASSIGN_OR_RAISE(auto values, MakeInt64Array(kLength, 1000));
+  auto table = arrow::Table::Make(arrow::schema({arrow::field("value", arrow::int64())}), {values});
+  parquet::WriterProperties::Builder writer_properties;
+  if (arrow::util::Codec::IsAvailable(arrow::Compression::SNAPPY)) {
+    writer_properties.compression(arrow::Compression::SNAPPY);
+  }
+  ARROW_ASSIGN_OR_RAISE(auto output, fs->OpenOutputStream(path));
+  ARROW_RETURN_NOT_OK(parquet::arrow::WriteTable(*table, arrow::default_memory_pool(), output,
+                                                 kLength / 16, writer_properties.build()));
+  ARROW_RETURN_NOT_OK(output->Close());
+
+  ARROW_RETURN_NOT_OK(Measure("dataset scan", [&]() -> arrow::Status {
+    auto format = std::make_shared<arrow::dataset::ParquetFileFormat>();
+    ARROW_ASSIGN_OR_RAISE(auto factory, arrow::dataset::FileSystemDatasetFactory::Make(
+                                            fs, {path}, format, arrow::dataset::FileSystemFactoryOptions{}));
+    ARROW_ASSIGN_OR_RAISE(auto dataset, factory->Finish());
+    ARROW_ASSIGN_OR_RAISE(auto builder, dataset->NewScan());
+    ARROW_RETURN_NOT_OK(builder->Filter(arrow::compute::greater(
+        arrow::compute::field_ref("value"), arrow::compute::literal(int64_t{500}))));
+    ARROW_RETURN_NOT_OK(builder->UseThreads(true));
+    ARROW_ASSIGN_OR_RAISE(auto scanner, builder->Finish());
+    ARROW_ASSIGN_OR_RAISE(auto result, scanner->ToTable());
+    return result->num_rows() > 0 ? arrow::Status::OK() : arrow::Status::Invalid("empty scan");
+  }));
+
+  return fs->DeleteFile(path);
+}
+#endif
+
 #define EXIT_ON_FAILURE(expr)                      \
   do {                                             \
     arrow::Status status_ = (expr);                \
@@ -186,5 +303,12 @@ int main(int argc, char** argv) {
 
   assert(rows.size() == expected_rows.size());
 
+#ifdef ARROW_COMPUTE
+  EXIT_ON_FAILURE(BenchmarkCompute());
+#endif
+#ifdef TEST_PACKAGE_DATASET_SCAN
+  EXIT_ON_FAILURE(BenchmarkDatasetScan());
+#endif
+
   return EXIT_SUCCESS;
 }
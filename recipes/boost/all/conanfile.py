@@ -97,6 +97,9 @@ class BoostConan(ConanFile):
         "lzma": [True, False],
         "zstd": [True, False],
         "segmented_stacks": [True, False],
+        "context_impl": [None, "fcontext", "ucontext", "winfib"],  # b2 context-impl feature, fcontext if None
+        "asio_io_uring": [True, False],  # enables BOOST_ASIO_HAS_IO_URING
+        "lto": [True, False],
         "debug_level": list(range(0, 14)),
         "pch": [True, False],
         "extra_b2_flags": [None, "ANY"],  # custom b2 flags
@@ -136,6 +139,9 @@ class BoostConan(ConanFile):
         "lzma": False,
         "zstd": False,
         "segmented_stacks": False,
+        "context_impl": None,
+        "asio_io_uring": False,
+        "lto": False,
         "debug_level": 0,
         "pch": True,
         "extra_b2_flags": None,
@@ -410,6 +416,9 @@ class BoostConan(ConanFile):
         if self.settings.os == "Windows":
             del self.options.with_stacktrace_backtrace
 
+        if self.settings.os != "Linux":
+            del self.options.asio_io_uring
+
         # nowide requires a c++11-able compiler + movable std::fstream: change default to not build on compiler with too old default c++ standard or too low compiler.cppstd
         # json requires a c++11-able compiler: change default to not build on compiler with too old default c++ standard or too low compiler.cppstd
         if self.settings.compiler.get_safe("cppstd"):
@@ -661,6 +670,12 @@ class BoostConan(ConanFile):
         if self.options.without_fiber:
             self.options.rm_safe("numa")
 
+        if self.options.header_only:
+            self.options.rm_safe("lto")
+
+        if self.options.without_context:
+            self.options.rm_safe("context_impl")
+
         # Use verbosity from [conf] if specified
         verbosity = self.conf.get("tools.build:verbosity", default="quiet")
         if verbosity == "verbose" and int(self.options.debug_level) < 2:
@@ -731,6 +746,14 @@ class BoostConan(ConanFile):
                 "Boost.Locale library needs either iconv or ICU library to be built on non windows platforms"
             )
 
+        context_impl = self.options.get_safe("context_impl")
+        if context_impl == "winfib" and self.settings.os != "Windows":
+            raise ConanInvalidConfiguration("Boost.Context winfib implementation is only available on Windows")
+        if context_impl == "ucontext" and self._is_windows_platform:
+            raise ConanInvalidConfiguration("Boost.Context ucontext implementation is not available on Windows")
+        if self.options.segmented_stacks and context_impl not in [None, "ucontext"]:
+            raise ConanInvalidConfiguration("Boost.Context segmented stacks require context_impl=ucontext")
+
         if self._stacktrace_addr2line_available:
             if not os.path.isabs(str(self.options.addr2line_location)):
                 raise ConanInvalidConfiguration("addr2line_location must be an absolute path to addr2line")
@@ -801,6 +824,10 @@ class BoostConan(ConanFile):
     def _with_iconv(self):
         return not self.options.header_only and self._with_dependency("iconv") and self.options.get_safe("i18n_backend_iconv") == "libiconv"
 
+    @property
+    def _with_liburing(self):
+        return self.options.get_safe("asio_io_uring", False)
+
     @property
     def _with_stacktrace_backtrace(self):
         return not self.options.header_only and self.options.get_safe("with_stacktrace_backtrace", False)
@@ -821,6 +848,9 @@ class BoostConan(ConanFile):
             self.requires("icu/74.2")
         if self._with_iconv:
             self.requires("libiconv/1.17")
+        if self._with_liburing:
+            # Boost.Asio headers include liburing.h when BOOST_ASIO_HAS_IO_URING is defined
+            self.requires("liburing/2.6", transitive_headers=True, transitive_libs=True)
 
     def package_id(self):
         del self.info.options.i18n_backend
@@ -1382,8 +1412,18 @@ class BoostConan(ConanFile):
             flags.append("define=BOOST_SYSTEM_USE_UTF8=1")
         if self.options.segmented_stacks:
             flags.extend(["segmented-stacks=on",
+                          "context-impl=ucontext",
                           "define=BOOST_USE_SEGMENTED_STACKS=1",
                           "define=BOOST_USE_UCONTEXT=1"])
+        elif self.options.get_safe("context_impl"):
+            # https://www.boost.org/doc/libs/1_86_0/libs/context/doc/html/context/cc/implementations__fcontext_t__ucontext_t_and_winfiber.html
+            flags.append(f"context-impl={self.options.context_impl}")
+            if self.options.context_impl == "ucontext":
+                flags.append("define=BOOST_USE_UCONTEXT=1")
+            elif self.options.context_impl == "winfib":
+                flags.append("define=BOOST_USE_WINFIB=1")
+        if self.options.get_safe("lto"):
+            flags.append("lto=on")
         flags.append("pch=on" if self.options.pch else "pch=off")
 
         if is_apple_os(self):
@@ -1410,6 +1450,13 @@ class BoostConan(ConanFile):
             flags.append("define=BOOST_STACKTRACE_LIBCXX_RUNTIME_MAY_CAUSE_MEMORY_LEAK=1")
         if self._with_iconv:
             flags.append(f"-sICONV_PATH={self.dependencies['libiconv'].package_folder}")
+        if self._with_liburing:
+            # Compiled libraries using Asio (e.g. cobalt, process) must see the same io_context implementation as consumers
+            liburing = self.dependencies["liburing"].cpp_info.aggregated_components()
+            flags.append("define=BOOST_ASIO_HAS_IO_URING=1")
+            flags.extend(f"include={includedir}" for includedir in liburing.includedirs)
+            link_flags.extend(f"-L{libdir}" for libdir in liburing.libdirs)
+            link_flags.extend(f"-l{lib}" for lib in liburing.libs)
         if self._with_icu:
             flags.append(f"-sICU_PATH={self.dependencies['icu'].package_folder}")
             if not self.dependencies["icu"].options.shared:
@@ -1766,6 +1813,14 @@ class BoostConan(ConanFile):
 
         if self.options.segmented_stacks:
             self.cpp_info.components["headers"].defines.extend(["BOOST_USE_SEGMENTED_STACKS", "BOOST_USE_UCONTEXT"])
+        elif self.options.get_safe("context_impl") == "ucontext":
+            self.cpp_info.components["headers"].defines.append("BOOST_USE_UCONTEXT")
+        elif self.options.get_safe("context_impl") == "winfib":
+            self.cpp_info.components["headers"].defines.append("BOOST_USE_WINFIB")
+
+        if self._with_liburing:
+            self.cpp_info.components["headers"].defines.append("BOOST_ASIO_HAS_IO_URING")
+            self.cpp_info.components["headers"].requires.append("liburing::liburing")
 
         if self.options.system_use_utf8:
             self.cpp_info.components["headers"].defines.append("BOOST_SYSTEM_USE_UTF8")
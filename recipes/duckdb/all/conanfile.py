@@ -39,6 +39,8 @@ class DuckdbConan(ConanFile):
         "with_shell": [True, False],
         "with_threads": [True, False],
         "with_rdtsc": [True, False],
+        "allocator": ["system", "jemalloc"],
+        "native": [True, False],
     }
     default_options = {
         "shared": False,
@@ -59,6 +61,12 @@ class DuckdbConan(ConanFile):
         "with_shell": False,
         "with_threads": True,
         "with_rdtsc": False,
+        "allocator": "system",
+        "native": False,
+    }
+    options_description = {
+        "allocator": "Memory allocator of the buffer manager, jemalloc is built as the jemalloc extension (Linux only)",
+        "native": "Compile for the instruction set of the build machine (-march=native)",
     }
     short_paths = True
 
@@ -74,6 +82,11 @@ class DuckdbConan(ConanFile):
             del self.options.fPIC
         if Version(self.version) >= "1.1.0":
             del self.options.with_odbc
+        if self.settings.os != "Linux":
+            del self.options.allocator
+        elif Version(self.version) < "0.10.1" or self.settings.arch == "x86_64":
+            # upstream default
+            self.options.allocator = "jemalloc"
 
     def configure(self):
         if self.options.shared:
@@ -96,6 +109,8 @@ class DuckdbConan(ConanFile):
         if Version(self.version) >= "0.9.2" and \
                 is_msvc(self) and self.options.shared and self.settings.build_type == "Debug":
             raise ConanInvalidConfiguration(f"{self.ref} does not support MSVC debug shared build")
+        if self.options.native and (is_msvc(self) or cross_building(self)):
+            raise ConanInvalidConfiguration("option native=True requires a native, non-MSVC build")
 
     def source(self):
         get(self, **self.conan_data["sources"][self.version], destination=self.source_folder, strip_root=True)
@@ -131,7 +146,12 @@ class DuckdbConan(ConanFile):
             build_extensions += ";inet"
         if self.options.with_sqlsmith:
             build_extensions += ";sqlsmith"
+        if self.options.get_safe("allocator") == "jemalloc":
+            build_extensions += ";jemalloc"
         tc.variables["BUILD_EXTENSIONS"] = build_extensions
+        # jemalloc is otherwise loaded by default on some platforms
+        if self.options.get_safe("allocator", "system") == "system":
+            tc.variables["SKIP_EXTENSIONS"] = "jemalloc"
 
         if "with_odbc" in self.options:
             tc.variables["BUILD_ODBC_DRIVER"] = self.options.with_odbc
@@ -140,6 +160,7 @@ class DuckdbConan(ConanFile):
         tc.variables["DISABLE_THREADS"] = not self.options.with_threads
         tc.variables["BUILD_UNITTESTS"] = False
         tc.variables["BUILD_RDTSC"] = self.options.with_rdtsc
+        tc.variables["NATIVE_ARCH"] = self.options.native
         tc.variables["EXTENSION_STATIC_BUILD"] = not self.options.shared
         tc.variables["ENABLE_SANITIZER"] = False
         tc.variables["ENABLE_UBSAN"] = False
@@ -219,8 +240,7 @@ class DuckdbConan(ConanFile):
                 self.cpp_info.libs.append("visualizer_extension")
             if self.options.with_httpfs:
                 self.cpp_info.libs.append("httpfs_extension")
-            if (self.settings.os == "Linux" and
-                (Version(self.version) < "0.10.1" or self.settings.arch == "x86_64")):
+            if self.options.get_safe("allocator") == "jemalloc":
                 self.cpp_info.libs.append("jemalloc_extension")
             if self.options.with_json:
                 self.cpp_info.libs.append("json_extension")
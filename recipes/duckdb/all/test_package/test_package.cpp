@@ -1,7 +1,51 @@
 #include <iostream>
 #include "duckdb.hpp"
 
+#ifdef DUCKDB_WITH_TPCH
+#include <chrono>
+#include <string>
+
+static double MillisecondsSince(std::chrono::steady_clock::time_point start) {
+    return std::chrono::duration<double, std::milli>(std::chrono::steady_clock::now() - start).count();
+}
+
+static bool Run(duckdb::Connection &con, const std::string &query, double &elapsed_ms) {
+    auto start = std::chrono::steady_clock::now();
+    auto result = con.Query(query);
+    elapsed_ms = MillisecondsSince(start);
+    if (result->HasError()) {
+        std::cerr << query << ": " << result->GetError() << std::endl;
+        return false;
+    }
+    return true;
+}
+
+// Generate TPC-H at scale factor 0.1 and time the 22 queries.
+static int BenchmarkTpch(duckdb::Connection &con) {
+    double elapsed_ms = 0;
+    con.Query("LOAD tpch");
+    if (!Run(con, "CALL dbgen(sf = 0.1)", elapsed_ms)) {
+        return 1;
+    }
+    std::cout << "tpch sf0.1 dbgen: " << elapsed_ms << " ms" << std::endl;
+
+    double total_ms = 0;
+    for (int q = 1; q <= 22; ++q) {
+        if (!Run(con, "PRAGMA tpch(" + std::to_string(q) + ")", elapsed_ms)) {
+            return 1;
+        }
+        total_ms += elapsed_ms;
+        std::cout << "tpch q" << q << ": " << elapsed_ms << " ms" << std::endl;
+    }
+    std::cout << "tpch total: " << total_ms << " ms" << std::endl;
+    return 0;
+}
+#endif
+
 int main() {
     duckdb::DuckDB db(nullptr);
 	duckdb::Connection con(db);
+#ifdef DUCKDB_WITH_TPCH
+    return BenchmarkTpch(con);
+#endif
 }
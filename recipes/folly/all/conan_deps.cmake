@@ -39,7 +39,18 @@ if (NOT MSVC)
     custom_find_package(LibDwarf LIBDWARF)
 endif()
 if (UNIX AND NOT APPLE)
-    custom_find_package(LibUring LIBURING)
+    if (NOT CMAKE_DISABLE_FIND_PACKAGE_LibUring)
+        custom_find_package(LibUring LIBURING)
+    endif()
     custom_find_package(LibUnwind LIBUNWIND)
     custom_find_package(Libiberty LIBIBERTY)
-endif()
\ No newline at end of file
+endif()
+
+# Allocator linked by every folly target, FOLLY_USE_JEMALLOC is defined by the conan toolchain
+if (FOLLY_CONAN_ALLOCATOR STREQUAL "jemalloc")
+    find_package(jemalloc REQUIRED CONFIG)
+    link_libraries(jemalloc::jemalloc)
+elseif (FOLLY_CONAN_ALLOCATOR STREQUAL "mimalloc")
+    find_package(mimalloc REQUIRED CONFIG)
+    link_libraries(mimalloc::mimalloc)
+endif()
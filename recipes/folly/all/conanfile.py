@@ -26,10 +26,19 @@ class FollyConan(ConanFile):
     options = {
         "shared": [True, False],
         "fPIC": [True, False],
+        "with_allocator": ["system", "jemalloc", "mimalloc"],
+        "with_liburing": [True, False],
     }
     default_options = {
         "shared": False,
         "fPIC": True,
+        "with_allocator": "system",
+        "with_liburing": True,
+    }
+    options_description = {
+        "with_allocator": "Link an allocator: jemalloc enables the FOLLY_USE_JEMALLOC fast paths (nallocx, sized deallocation), "
+                          "mimalloc must be built with override=True",
+        "with_liburing": "Build the io_uring based async IO backends",
     }
 
     @property
@@ -53,6 +62,8 @@ class FollyConan(ConanFile):
     def config_options(self):
         if self.settings.os == "Windows":
             del self.options.fPIC
+        if self.settings.os != "Linux":
+            del self.options.with_liburing
 
     def configure(self):
         if self.options.shared:
@@ -84,8 +95,13 @@ class FollyConan(ConanFile):
         if self.settings.os in ["Linux", "FreeBSD"]:
             self.requires("libiberty/9.1.0")
             self.requires("libunwind/1.8.0")
-        if self.settings.os == "Linux":
+        if self.options.get_safe("with_liburing"):
             self.requires("liburing/2.6")
+        if self.options.with_allocator == "jemalloc":
+            # folly/portability/Malloc.h includes jemalloc/jemalloc.h when FOLLY_USE_JEMALLOC is set
+            self.requires("jemalloc/5.3.0", transitive_headers=True, transitive_libs=True)
+        elif self.options.with_allocator == "mimalloc":
+            self.requires("mimalloc/2.1.7", transitive_libs=True)
         # INFO: Folly does not support fmt 11 on MSVC: https://github.com/facebook/folly/issues/2250
         self.requires("fmt/10.2.1", transitive_headers=True, transitive_libs=True)
 
@@ -128,6 +144,11 @@ class FollyConan(ConanFile):
             required_components = ", ".join(self._required_boost_components)
             raise ConanInvalidConfiguration(f"{self.ref} requires these Boost components: {required_components}. Try with '-o boost/*:without_{required_components}=False'")
 
+        if self.options.with_allocator == "jemalloc" and self.dependencies["jemalloc"].options.prefix:
+            raise ConanInvalidConfiguration(f"{self.ref} requires jemalloc without symbols prefix. Use -o 'jemalloc/*:prefix='")
+        if self.options.with_allocator == "mimalloc" and not self.dependencies["mimalloc"].options.override:
+            raise ConanInvalidConfiguration(f"{self.ref} requires mimalloc overriding malloc. Use -o 'mimalloc/*:override=True'")
+
     def source(self):
         get(self, **self.conan_data["sources"][self.version], strip_root=False)
 
@@ -176,6 +197,13 @@ class FollyConan(ConanFile):
             tc.cache_variables["BOOST_LINK_STATIC"] = not self.dependencies["boost"].options.shared
 
         tc.cache_variables["CMAKE_POLICY_DEFAULT_CMP0074"] = "NEW"  # Honor Boost_ROOT set by boost recipe
+
+        if not self.options.get_safe("with_liburing"):
+            # Do not pick a system liburing
+            tc.cache_variables["CMAKE_DISABLE_FIND_PACKAGE_LibUring"] = True
+        tc.cache_variables["FOLLY_CONAN_ALLOCATOR"] = str(self.options.with_allocator)
+        if self.options.with_allocator == "jemalloc":
+            tc.preprocessor_definitions["FOLLY_USE_JEMALLOC"] = "1"
         tc.generate()
 
         deps = CMakeDeps(self)
@@ -192,6 +220,7 @@ class FollyConan(ConanFile):
         deps.set_property("libunwind", "cmake_file_name", "LibUnwind")
         deps.set_property("liburing", "cmake_file_name", "LibUring")
         deps.set_property("lz4", "cmake_file_name", "LZ4")
+        deps.set_property("mimalloc", "cmake_target_name", "mimalloc::mimalloc")
         deps.set_property("openssl", "cmake_file_name", "OpenSSL")
         deps.set_property("snappy", "cmake_file_name", "Snappy")
         deps.set_property("xz_utils", "cmake_file_name", "LibLZMA")
@@ -252,8 +281,14 @@ class FollyConan(ConanFile):
             self.cpp_info.components["libfolly"].requires.append("libdwarf::libdwarf")
         if self.settings.os in ["Linux", "FreeBSD"]:
             self.cpp_info.components["libfolly"].requires.extend(["libiberty::libiberty", "libunwind::libunwind"])
-        if self.settings.os == "Linux":
+        if self.options.get_safe("with_liburing"):
             self.cpp_info.components["libfolly"].requires.append("liburing::liburing")
+        if self.options.with_allocator == "jemalloc":
+            self.cpp_info.components["libfolly"].requires.append("jemalloc::jemalloc")
+            self.cpp_info.components["libfolly"].defines.append("FOLLY_USE_JEMALLOC=1")
+        elif self.options.with_allocator == "mimalloc":
+            self.cpp_info.components["libfolly"].requires.append("mimalloc::mimalloc")
+        if self.settings.os == "Linux":
             self.cpp_info.components["libfolly"].system_libs.extend(["pthread", "dl", "rt"])
             self.cpp_info.components["libfolly"].defines.extend(["FOLLY_HAVE_ELF", "FOLLY_HAVE_DWARF"])
         elif self.settings.os == "Windows":
@@ -2,3 +2,12 @@
 if (TARGET check_epollexclusive)
     set_target_properties(check_epollexclusive PROPERTIES LINKER_LANGUAGE CXX)
 endif()
+
+# Allocator linked by every grpc target
+if (GRPC_CONAN_ALLOCATOR STREQUAL "tcmalloc")
+    find_package(gperftools REQUIRED CONFIG)
+    link_libraries(gperftools::gperftools)
+elseif (GRPC_CONAN_ALLOCATOR STREQUAL "mimalloc")
+    find_package(mimalloc REQUIRED CONFIG)
+    link_libraries(mimalloc::mimalloc)
+endif()
@@ -1,13 +1,15 @@
+import glob
 import os
+import re
 import yaml
 
 from conan import ConanFile
-from conan.errors import ConanInvalidConfiguration
+from conan.errors import ConanException, ConanInvalidConfiguration
 from conan.tools.apple import is_apple_os
 from conan.tools.build import cross_building, valid_min_cppstd, check_min_cppstd
 from conan.tools.cmake import cmake_layout, CMake, CMakeToolchain, CMakeDeps
 from conan.tools.env import VirtualBuildEnv, VirtualRunEnv
-from conan.tools.files import apply_conandata_patches, copy, export_conandata_patches, get, rename, replace_in_file, rmdir
+from conan.tools.files import apply_conandata_patches, copy, export_conandata_patches, get, load, rename, replace_in_file, rmdir, save
 from conan.tools.microsoft import check_min_vs, is_msvc
 from conan.tools.scm import Version
 
@@ -39,7 +41,10 @@ class GrpcConan(ConanFile):
         "ruby_plugin": [True, False],
         "otel_plugin": [True, False],
         "secure": [True, False],
-        "with_libsystemd": [True, False]
+        "with_libsystemd": [True, False],
+        "poll_strategy": ["all", "epoll1", "poll"],
+        "experiments": [None, "ANY"],
+        "with_allocator": ["system", "tcmalloc", "mimalloc"],
     }
     default_options = {
         "shared": False,
@@ -55,7 +60,16 @@ class GrpcConan(ConanFile):
         "ruby_plugin": True,
         "otel_plugin": False,
         "secure": False,
-        "with_libsystemd": True
+        "with_libsystemd": True,
+        "poll_strategy": "all",
+        "experiments": None,
+        "with_allocator": "system",
+    }
+    options_description = {
+        "poll_strategy": "Default value of GRPC_POLL_STRATEGY compiled into grpc, still overridable at runtime",
+        "experiments": "Default value of GRPC_EXPERIMENTS compiled into grpc: comma separated experiment names, "
+                       "prefixed with '-' to disable them (e.g. 'event_engine_client,event_engine_listener')",
+        "with_allocator": "Link grpc and its consumers against tcmalloc (gperftools) or mimalloc, the latter must be built with override=True",
     }
 
     short_paths = True
@@ -92,6 +106,11 @@ class GrpcConan(ConanFile):
             del self.options.with_libsystemd
         if Version(self.version) < "1.65.0":
             del self.options.otel_plugin
+        if Version(self.version) < "1.51.0":
+            # GRPC_EXPERIMENTS was added in 1.51, read through GPR_GLOBAL_CONFIG until 1.54 and through ConfigVars since 1.55
+            del self.options.experiments
+        if self.settings.os == "Windows":
+            del self.options.poll_strategy
 
     def configure(self):
         if self.options.shared:
@@ -125,6 +144,10 @@ class GrpcConan(ConanFile):
                 self.requires("libsystemd/255")
         if self.options.get_safe("otel_plugin"):
             self.requires("opentelemetry-cpp/1.14.2")
+        if self.options.with_allocator == "tcmalloc":
+            self.requires("gperftools/2.16", transitive_libs=True)
+        elif self.options.with_allocator == "mimalloc":
+            self.requires("mimalloc/2.1.7", transitive_libs=True)
 
     def package_id(self):
         del self.info.options.secure
@@ -146,6 +169,14 @@ class GrpcConan(ConanFile):
                 "Please, use `protobuf:shared=True`.",
             )
 
+        if self.options.get_safe("poll_strategy") == "epoll1" and self.settings.os not in ["Linux", "Android"]:
+            raise ConanInvalidConfiguration(f"{self.ref} epoll1 poller is only available on Linux")
+        experiments = self.options.get_safe("experiments")
+        if experiments and not re.match(r"^-?[a-z0-9_]+(,-?[a-z0-9_]+)*$", str(experiments)):
+            raise ConanInvalidConfiguration(f"{self.ref} experiments must be a comma separated list of experiment names")
+        if self.options.with_allocator == "mimalloc" and not self.dependencies["mimalloc"].options.override:
+            raise ConanInvalidConfiguration(f"{self.ref} requires mimalloc overriding malloc. Use -o 'mimalloc/*:override=True'")
+
     def build_requirements(self):
         if not self._is_legacy_one_profile:
             self.tool_requires("protobuf/<host_version>")
@@ -212,11 +243,48 @@ class GrpcConan(ConanFile):
         if Version(self.version) >= "1.62.0":
             tc.cache_variables["gRPC_DOWNLOAD_ARCHIVES"] = False
 
+        tc.cache_variables["GRPC_CONAN_ALLOCATOR"] = str(self.options.with_allocator)
+
         tc.generate()
 
         cmake_deps = CMakeDeps(self)
+        if self.options.with_allocator == "mimalloc":
+            cmake_deps.set_property("mimalloc", "cmake_target_name", "mimalloc::mimalloc")
         cmake_deps.generate()
 
+    def _patch_config_defaults(self):
+        # Defaults of the GRPC_* environment variables, read through ConfigVars since 1.55,
+        # and through GPR_GLOBAL_CONFIG_DEFINE_* in older versions
+        defaults = {}
+        if self.options.get_safe("poll_strategy", "all") != "all":
+            defaults["poll_strategy"] = str(self.options.poll_strategy)
+        if self.options.get_safe("experiments"):
+            defaults["experiments"] = str(self.options.experiments)
+        if not defaults:
+            return
+        candidates = []
+        for name in ["config_vars.cc", "ev_posix.cc"]:
+            candidates.extend(glob.glob(os.path.join(self.source_folder, "src", "core", "**", name), recursive=True))
+        # GRPC_EXPERIMENTS is declared next to the experiments list before 1.55
+        experiments_config = os.path.join(self.source_folder, "src", "core", "lib", "experiments", "config.cc")
+        if os.path.isfile(experiments_config):
+            candidates.append(experiments_config)
+        for name, value in defaults.items():
+            patterns = [
+                rf'("GRPC_{name.upper()}",\s*overrides\.{name},\s*)"[^"]*"',
+                rf'(GPR_GLOBAL_CONFIG_DEFINE_STRING\(\s*grpc_{name},\s*)"[^"]*"',
+            ]
+            patched = False
+            for candidate in candidates:
+                content = load(self, candidate)
+                for pattern in patterns:
+                    content, count = re.subn(pattern, rf'\g<1>"{value}"', content)
+                    if count:
+                        save(self, candidate, content)
+                        patched = True
+            if not patched:
+                raise ConanException(f"Could not find the default value of GRPC_{name.upper()} in grpc sources")
+
     def _patch_sources(self):
         apply_conandata_patches(self)
 
@@ -239,6 +307,8 @@ class GrpcConan(ConanFile):
             replace_in_file(self, cmakelists,
                             "COMMAND ${_gRPC_PROTOBUF_PROTOC_EXECUTABLE}",
                             'COMMAND ${CMAKE_COMMAND} -E env "LD_LIBRARY_PATH=$<JOIN:${CMAKE_LIBRARY_PATH},:>:$ENV{LD_LIBRARY_PATH}" ${_gRPC_PROTOBUF_PROTOC_EXECUTABLE}')
+        self._patch_config_defaults()
+
         if self.settings.os == "Macos" and Version(self.version) >= "1.64":
             # See https://github.com/grpc/grpc/issues/36654#issuecomment-2228569158
             replace_in_file(self, cmakelists, "target_compile_features(upb_textformat_lib PUBLIC cxx_std_14)",
@@ -310,6 +380,12 @@ class GrpcConan(ConanFile):
         def libsystemd():
             return ["libsystemd::libsystemd"] if self._supports_libsystemd and self.options.with_libsystemd else []
 
+        def allocator():
+            return {
+                "tcmalloc": ["gperftools::gperftools"],
+                "mimalloc": ["mimalloc::mimalloc"],
+            }.get(str(self.options.with_allocator), [])
+
         def libm():
             return ["m"] if self.settings.os in ["Linux", "FreeBSD"] else []
 
@@ -334,7 +410,7 @@ class GrpcConan(ConanFile):
                 continue
             components[target['name']] = {
                 "lib": target['lib'],
-                "requires": target.get('requires', []) + libsystemd(),
+                "requires": target.get('requires', []) + libsystemd() + allocator(),
                 "system_libs": libm() + pthread() + crypt32() + ws2_32() + wsock32(),
                 "frameworks": target.get('frameworks', []),
             }
@@ -35,6 +35,11 @@ class JemallocConan(ConanFile):
         "enable_initial_exec_tls": [True, False],
         "enable_libdl": [True, False],
         "enable_prof": [True, False],
+        "enable_stats": [True, False],
+        "lg_page": [None, "ANY"],
+        "lg_hugepage": [None, "ANY"],
+        "lg_quantum": [None, "ANY"],
+        "malloc_conf": [None, "ANY"],
     }
     default_options = {
         "shared": False,
@@ -50,6 +55,18 @@ class JemallocConan(ConanFile):
         "enable_initial_exec_tls": True,
         "enable_libdl": True,
         "enable_prof": False,
+        "enable_stats": True,
+        "lg_page": None,
+        "lg_hugepage": None,
+        "lg_quantum": None,
+        "malloc_conf": None,
+    }
+    options_description = {
+        "enable_stats": "Enable statistics gathering, disabling it removes bookkeeping from the allocation fast path",
+        "lg_page": "Base 2 log of the system page size (e.g. 16 for 64 KiB pages), detected at build time if unset",
+        "lg_hugepage": "Base 2 log of the system huge page size (e.g. 21 for 2 MiB pages), detected at build time if unset",
+        "lg_quantum": "Base 2 log of the minimum allocation alignment",
+        "malloc_conf": "Embedded default options string, e.g. 'background_thread:true,dirty_decay_ms:5000'",
     }
 
     @property
@@ -124,6 +141,13 @@ class JemallocConan(ConanFile):
         if self.settings.os == "Macos" and self.settings.arch == "armv8":
             if Version(self.version) < "5.3.0":
                 raise ConanInvalidConfiguration("Support for Apple Silicon is only available as of 5.3.0.")
+        # 4. Build-time constants
+        for option in ("lg_page", "lg_hugepage", "lg_quantum"):
+            value = self.options.get_safe(option)
+            if value != None and not str(value).isdigit():
+                raise ConanInvalidConfiguration(f"option {option} must be a base 2 logarithm, got '{value}'")
+        if self.options.malloc_conf and any(c.isspace() for c in str(self.options.malloc_conf)):
+            raise ConanInvalidConfiguration("option malloc_conf must not contain whitespace")
 
     def source(self):
         get(self, **self.conan_data["sources"][self.version], strip_root=True)
@@ -146,7 +170,13 @@ class JemallocConan(ConanFile):
             enable_disable("initial-exec-tls", self.options.enable_initial_exec_tls),
             enable_disable("libdl", self.options.enable_libdl),
             enable_disable("prof", self.options.enable_prof),
+            enable_disable("stats", self.options.enable_stats),
         ])
+        for option in ("lg_page", "lg_hugepage", "lg_quantum"):
+            if self.options.get_safe(option) != None:
+                tc.configure_args.append(f"--with-{option.replace('_', '-')}={self.options.get_safe(option)}")
+        if self.options.malloc_conf:
+            tc.configure_args.append(f"--with-malloc-conf={self.options.malloc_conf}")
         env = tc.environment()
         if is_msvc(self):
             # Do not check whether the math library exists when compiled by MSVC
@@ -1,5 +1,9 @@
 #include <jemalloc/jemalloc.h>
 
+#include <stdbool.h>
+#include <stddef.h>
+#include <stdint.h>
+#include <stdio.h>
 #include <stdlib.h>
 
 void do_something(size_t i) {
@@ -7,13 +11,59 @@ void do_something(size_t i) {
     malloc(i * 100);
 }
 
+static void print_size(const char *name) {
+    size_t value = 0;
+    size_t len = sizeof(value);
+    if (mallctl(name, &value, &len, NULL, 0) == 0) {
+        printf("%s: %zu\n", name, value);
+    }
+}
+
 int main() {
     for (size_t i = 0; i < 1000; i++) {
         do_something(i);
     }
 
-    // Dump allocator statistics to stderr.
-    malloc_stats_print(NULL, NULL, NULL);
+    // Build-time page and quantum constants.
+    unsigned nbins = 0;
+    size_t len = sizeof(nbins);
+    print_size("arenas.page");
+    print_size("arenas.quantum");
+    if (mallctl("arenas.nbins", &nbins, &len, NULL, 0) == 0) {
+        printf("arenas.nbins: %u\n", nbins);
+    }
+
+    // Options baked in through malloc_conf.
+    bool background_thread = false;
+    len = sizeof(background_thread);
+    if (mallctl("opt.background_thread", &background_thread, &len, NULL, 0) == 0) {
+        printf("opt.background_thread: %s\n", background_thread ? "true" : "false");
+    }
+    // ssize_t is not available everywhere, ptrdiff_t has the same size
+    ptrdiff_t dirty_decay_ms = 0;
+    len = sizeof(dirty_decay_ms);
+    if (mallctl("opt.dirty_decay_ms", &dirty_decay_ms, &len, NULL, 0) == 0) {
+        printf("opt.dirty_decay_ms: %td\n", dirty_decay_ms);
+    }
+
+    // Statistics are only available if jemalloc was built with them.
+    bool config_stats = false;
+    len = sizeof(config_stats);
+    mallctl("config.stats", &config_stats, &len, NULL, 0);
+    printf("config.stats: %s\n", config_stats ? "true" : "false");
+    if (config_stats) {
+        // Refresh the cached statistics before reading them.
+        uint64_t epoch = 1;
+        len = sizeof(epoch);
+        mallctl("epoch", &epoch, &len, &epoch, len);
+        print_size("stats.allocated");
+        print_size("stats.active");
+        print_size("stats.resident");
+        print_size("stats.mapped");
+
+        // Dump allocator statistics to stderr.
+        malloc_stats_print(NULL, NULL, NULL);
+    }
 
     return 0;
 }
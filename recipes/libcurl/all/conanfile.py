@@ -1,5 +1,5 @@
 from conan import ConanFile
-from conan.errors import ConanInvalidConfiguration
+from conan.errors import ConanException, ConanInvalidConfiguration
 from conan.tools.apple import is_apple_os, fix_apple_shared_install_name
 from conan.tools.build import cross_building
 from conan.tools.cmake import CMake, CMakeToolchain, CMakeDeps, cmake_layout
@@ -52,6 +52,7 @@ class LibcurlConan(ConanFile):
         "with_libpsl": [True, False],
         "with_largemaxwritesize": [True, False],
         "with_nghttp2": [True, False],
+        "with_http3": [True, False],
         "with_zlib": [True, False],
         "with_brotli": [True, False],
         "with_zstd": [True, False],
@@ -72,6 +73,9 @@ class LibcurlConan(ConanFile):
         "with_ca_bundle": [False, "auto", "ANY"],
         "with_ca_path": [False, "auto", "ANY"],
         "with_ca_fallback": [True, False],
+        "connection_cache_size": [None, "ANY"],
+        "max_host_connections": [None, "ANY"],
+        "max_total_connections": [None, "ANY"],
     }
     default_options = {
         "shared": False,
@@ -98,6 +102,7 @@ class LibcurlConan(ConanFile):
         "with_libpsl": False,
         "with_largemaxwritesize": False,
         "with_nghttp2": False,
+        "with_http3": False,
         "with_zlib": True,
         "with_brotli": False,
         "with_zstd": False,
@@ -118,6 +123,15 @@ class LibcurlConan(ConanFile):
         "with_ca_bundle": "auto",
         "with_ca_path": "auto",
         "with_ca_fallback": False,
+        "connection_cache_size": None,
+        "max_host_connections": None,
+        "max_total_connections": None,
+    }
+    options_description = {
+        "with_http3": "Enable HTTP/3 through nghttp3 and the OpenSSL QUIC stack (requires openssl >= 3.3)",
+        "connection_cache_size": "Default connection cache size of easy handles (CURLOPT_MAXCONNECTS), upstream default is 5",
+        "max_host_connections": "Default CURLMOPT_MAX_HOST_CONNECTIONS of multi handles, upstream default is 0 (unlimited)",
+        "max_total_connections": "Default CURLMOPT_MAX_TOTAL_CONNECTIONS of multi handles, upstream default is 0 (unlimited)",
     }
 
     @property
@@ -148,6 +162,9 @@ class LibcurlConan(ConanFile):
 
         if Version(self.version) < "8.7.0":
             del self.options.with_misc_docs
+        if Version(self.version) < "8.6.0":
+            # OpenSSL QUIC backend was added in 8.6.0
+            del self.options.with_http3
 
         # Default options
         self.options.with_ssl = "darwinssl" if is_apple_os(self) else "openssl"
@@ -166,13 +183,18 @@ class LibcurlConan(ConanFile):
 
     def requirements(self):
         if self.options.with_ssl == "openssl":
-            self.requires("openssl/[>=1.1 <4]")
+            if self.options.get_safe("with_http3"):
+                self.requires("openssl/[>=3.3 <4]")
+            else:
+                self.requires("openssl/[>=1.1 <4]")
         elif self.options.with_ssl == "wolfssl":
             self.requires("wolfssl/5.6.6")
         elif self.options.with_ssl == "mbedtls":
             self.requires("mbedtls/3.5.0")
         if self.options.with_nghttp2:
             self.requires("libnghttp2/1.59.0")
+        if self.options.get_safe("with_http3"):
+            self.requires("nghttp3/1.6.0")
         if self.options.with_libssh2:
             self.requires("libssh2/1.11.0")
         if self.options.with_zlib:
@@ -197,6 +219,15 @@ class LibcurlConan(ConanFile):
                 raise ConanInvalidConfiguration("option with_ntlm=True requires openssl:no_des=False")
         if self.options.with_ssl == "wolfssl" and not self.dependencies["wolfssl"].options.with_curl:
             raise ConanInvalidConfiguration("option with_ssl=wolfssl requires wolfssl:with_curl=True")
+        if self.options.get_safe("with_http3"):
+            if self.options.with_ssl != "openssl":
+                raise ConanInvalidConfiguration("option with_http3=True requires with_ssl=openssl")
+            if Version(self.dependencies["openssl"].ref.version) < "3.3.0":
+                raise ConanInvalidConfiguration("option with_http3=True requires openssl >= 3.3.0")
+        for option in ("connection_cache_size", "max_host_connections", "max_total_connections"):
+            value = self.options.get_safe(option)
+            if value and not str(value).isdigit():
+                raise ConanInvalidConfiguration(f"option {option} must be a non-negative integer, got '{value}'")
 
     def build_requirements(self):
         if self._is_using_cmake_build:
@@ -256,6 +287,7 @@ class LibcurlConan(ConanFile):
     def _patch_sources(self):
         apply_conandata_patches(self)
         self._patch_misc_files()
+        self._patch_connection_defaults()
         self._patch_autotools()
         self._patch_cmake()
 
@@ -273,6 +305,28 @@ class LibcurlConan(ConanFile):
                                       "#define CURL_BUILD_MAC_10_13 MAC_OS_X_VERSION_MAX_ALLOWED >= 101300",
                                       "#define CURL_BUILD_MAC_10_13 0")
 
+    def _patch_connection_defaults(self):
+        cache_size = self.options.connection_cache_size
+        if cache_size:
+            urldata_h = os.path.join(self.source_folder, "lib", "urldata.h")
+            content, count = re.subn(r"(#define DEFAULT_CONNCACHE_SIZE)\s+\d+", rf"\g<1> {cache_size}", load(self, urldata_h))
+            if count != 1:
+                raise ConanException(f"Could not find DEFAULT_CONNCACHE_SIZE in {urldata_h}")
+            save(self, urldata_h, content)
+
+        multi_limits = {
+            "max_host_connections": self.options.max_host_connections,
+            "max_total_connections": self.options.max_total_connections,
+        }
+        if any(multi_limits.values()):
+            # members are zero-initialized by Curl_multi_handle(), set them next to the other multi defaults
+            multi_c = os.path.join(self.source_folder, "lib", "multi.c")
+            assignments = "".join(f"\n  multi->{name} = {value};" for name, value in multi_limits.items() if value)
+            content, count = re.subn(r"(\n\s*multi->max_concurrent_streams = \d+;)", rf"\g<1>{assignments}", load(self, multi_c))
+            if count != 1:
+                raise ConanException(f"Could not find multi handle defaults in {multi_c}")
+            save(self, multi_c, content)
+
     def _patch_autotools(self):
         if self._is_using_cmake_build:
             return
@@ -378,6 +432,12 @@ class LibcurlConan(ConanFile):
         replace_in_file(self, cmakelists, "${NGHTTP2_INCLUDE_DIRS}", "${libnghttp2_INCLUDE_DIRS}")
         replace_in_file(self, cmakelists, "${NGHTTP2_LIBRARIES}", "libnghttp2::nghttp2")
 
+        # nghttp3
+        if self.options.get_safe("with_http3"):
+            replace_in_file(self, cmakelists, "find_package(NGHTTP3 REQUIRED)", "find_package(nghttp3 REQUIRED CONFIG)")
+            replace_in_file(self, cmakelists, "${NGHTTP3_INCLUDE_DIRS}", "${nghttp3_INCLUDE_DIRS}")
+            replace_in_file(self, cmakelists, "${NGHTTP3_LIBRARIES}", "nghttp3::nghttp3")
+
         # wolfssl
         replace_in_file(self, cmakelists, "find_package(WolfSSL REQUIRED)", "find_package(wolfssl REQUIRED CONFIG)")
         if Version(self.version) < "8.10.0":
@@ -480,6 +540,11 @@ class LibcurlConan(ConanFile):
         else:
             tc.configure_args.append("--without-nghttp2")
 
+        if self.options.get_safe("with_http3"):
+            path = unix_path(self, self.dependencies["nghttp3"].package_folder)
+            tc.configure_args.append(f"--with-nghttp3={path}")
+            tc.configure_args.append("--with-openssl-quic")
+
         if self.options.with_zlib:
             path = unix_path(self, self.dependencies["zlib"].package_folder)
             tc.configure_args.append(f"--with-zlib={path}")
@@ -593,6 +658,8 @@ class LibcurlConan(ConanFile):
         tc.variables["CURL_USE_WOLFSSL"] = self.options.with_ssl == "wolfssl"
         tc.variables["CURL_USE_MBEDTLS"] = self.options.with_ssl == "mbedtls"
         tc.variables["USE_NGHTTP2"] = self.options.with_nghttp2
+        if "with_http3" in self.options:
+            tc.variables["USE_OPENSSL_QUIC"] = self.options.with_http3
         tc.variables["CURL_ZLIB"] = self.options.with_zlib
         tc.variables["CURL_BROTLI"] = self.options.with_brotli
         tc.variables["CURL_ZSTD"] = self.options.with_zstd
@@ -709,6 +776,8 @@ class LibcurlConan(ConanFile):
             self.cpp_info.components["curl"].requires.append("mbedtls::mbedtls")
         if self.options.with_nghttp2:
             self.cpp_info.components["curl"].requires.append("libnghttp2::libnghttp2")
+        if self.options.get_safe("with_http3"):
+            self.cpp_info.components["curl"].requires.append("nghttp3::nghttp3")
         if self.options.with_libssh2:
             self.cpp_info.components["curl"].requires.append("libssh2::libssh2")
         if self.options.with_zlib:
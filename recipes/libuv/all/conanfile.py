@@ -1,6 +1,7 @@
 from conan import ConanFile
+from conan.errors import ConanInvalidConfiguration
 from conan.tools.cmake import CMake, CMakeToolchain, cmake_layout
-from conan.tools.files import apply_conandata_patches, copy, export_conandata_patches, get, rmdir, save
+from conan.tools.files import apply_conandata_patches, copy, export_conandata_patches, get, replace_in_file, rmdir, save
 from conan.tools.microsoft import is_msvc, check_min_vs
 from conan.tools.scm import Version
 import os
@@ -21,10 +22,20 @@ class LibuvConan(ConanFile):
     options = {
         "shared": [True, False],
         "fPIC": [True, False],
+        "use_io_uring": [None, True, False],
+        "threadpool_size": [None, "ANY"],
     }
     default_options = {
         "shared": False,
         "fPIC": True,
+        "use_io_uring": None,
+        "threadpool_size": None,
+    }
+    options_description = {
+        "use_io_uring": "Default for the io_uring file system operations when UV_USE_IO_URING is not set "
+                        "(None keeps the upstream default)",
+        "threadpool_size": "Default size of the thread pool when UV_THREADPOOL_SIZE is not set "
+                           "(None keeps the upstream default of 4)",
     }
 
     def export_sources(self):
@@ -33,6 +44,9 @@ class LibuvConan(ConanFile):
     def config_options(self):
         if self.settings.os == "Windows":
             del self.options.fPIC
+        # io_uring support was added in 1.45.0
+        if self.settings.os != "Linux" or Version(self.version) < "1.45.0":
+            del self.options.use_io_uring
 
     def configure(self):
         if self.options.shared:
@@ -46,6 +60,11 @@ class LibuvConan(ConanFile):
     def validate(self):
         if is_msvc(self):
             check_min_vs(self, "190")
+        if self.options.threadpool_size:
+            threadpool_size = str(self.options.threadpool_size)
+            # MAX_THREADPOOL_SIZE in src/threadpool.c
+            if not threadpool_size.isdigit() or not 1 <= int(threadpool_size) <= 1024:
+                raise ConanInvalidConfiguration("threadpool_size must be an integer between 1 and 1024")
 
     def source(self):
         get(self, **self.conan_data["sources"][self.version], strip_root=True)
@@ -57,8 +76,21 @@ class LibuvConan(ConanFile):
             tc.variables["LIBUV_BUILD_SHARED"] = self.options.shared
         tc.generate()
 
-    def build(self):
+    def _patch_sources(self):
         apply_conandata_patches(self)
+        if self.options.threadpool_size:
+            # The default number of threads is the size of this array
+            replace_in_file(self, os.path.join(self.source_folder, "src", "threadpool.c"),
+                            "static uv_thread_t default_threads[4];",
+                            f"static uv_thread_t default_threads[{self.options.threadpool_size}];")
+        if self.options.get_safe("use_io_uring") != None:
+            default = "1" if self.options.use_io_uring else "0"
+            replace_in_file(self, os.path.join(self.source_folder, "src", "unix", "linux.c"),
+                            'val = getenv("UV_USE_IO_URING");',
+                            f'val = getenv("UV_USE_IO_URING");\n    if (val == NULL)\n      val = "{default}";')
+
+    def build(self):
+        self._patch_sources()
         cmake = CMake(self)
         cmake.configure()
         cmake.build()
@@ -1,7 +1,58 @@
 #include <stdio.h>
 #include <stdlib.h>
+#include <string.h>
 #include <uv.h>
 
+#define BENCHMARK_FILE "libuv_benchmark.tmp"
+#define BENCHMARK_READS 10000
+#define BENCHMARK_READ_SIZE 512
+
+static uv_fs_t read_reqs[BENCHMARK_READS];
+static char read_buffers[BENCHMARK_READS][BENCHMARK_READ_SIZE];
+static int completed_reads = 0;
+
+static void on_read(uv_fs_t *req) {
+	if (req->result == BENCHMARK_READ_SIZE) {
+		++completed_reads;
+	}
+	uv_fs_req_cleanup(req);
+}
+
+// Fan out concurrent reads of the same file, served by the thread pool or io_uring
+static int benchmark_fs_reads(uv_loop_t *loop) {
+	char content[BENCHMARK_READ_SIZE];
+	uv_fs_t req;
+	uv_buf_t buf;
+	uv_file fd;
+	uint64_t start;
+	int i;
+
+	memset(content, 'c', sizeof(content));
+	fd = uv_fs_open(NULL, &req, BENCHMARK_FILE, UV_FS_O_CREAT | UV_FS_O_TRUNC | UV_FS_O_RDWR, 0644, NULL);
+	uv_fs_req_cleanup(&req);
+	if (fd < 0) {
+		return 1;
+	}
+	buf = uv_buf_init(content, sizeof(content));
+	uv_fs_write(NULL, &req, fd, &buf, 1, 0, NULL);
+	uv_fs_req_cleanup(&req);
+
+	start = uv_hrtime();
+	for (i = 0; i < BENCHMARK_READS; ++i) {
+		buf = uv_buf_init(read_buffers[i], BENCHMARK_READ_SIZE);
+		uv_fs_read(loop, &read_reqs[i], fd, &buf, 1, 0, on_read);
+	}
+	uv_run(loop, UV_RUN_DEFAULT);
+	printf("%d fs reads completed in %.3f ms\n", completed_reads, (uv_hrtime() - start) / 1e6);
+
+	uv_fs_close(NULL, &req, fd, NULL);
+	uv_fs_req_cleanup(&req);
+	uv_fs_unlink(NULL, &req, BENCHMARK_FILE, NULL);
+	uv_fs_req_cleanup(&req);
+
+	return completed_reads == BENCHMARK_READS ? 0 : 1;
+}
+
 int main() {
 #ifdef _WIN32
 	// probably bug:
@@ -18,6 +69,13 @@ int main() {
 	printf("Package test completed successfully\n");
 	uv_run(loop, UV_RUN_DEFAULT);
 
+	if (benchmark_fs_reads(loop) != 0) {
+		fprintf(stderr, "fs reads benchmark failed\n");
+		uv_loop_close(loop);
+		free(loop);
+		return 1;
+	}
+
 	uv_loop_close(loop);
 	free(loop);
 
@@ -28,6 +28,14 @@ class LlamaCppConan(ConanFile):
         "with_examples": [True, False],
         "with_cuda": [True, False],
         "with_curl": [True, False],
+        "with_openmp": [True, False],
+        "with_blas": [True, False],
+        "native": [True, False],
+        "avx": [True, False],
+        "avx2": [True, False],
+        "avx512": [True, False],
+        "fma": [True, False],
+        "f16c": [True, False],
     }
     default_options = {
         "shared": False,
@@ -35,7 +43,30 @@ class LlamaCppConan(ConanFile):
         "with_examples": False,
         "with_cuda": False,
         "with_curl": False,
+        "with_openmp": True,
+        "with_blas": False,
+        "native": False,
+        "avx": True,
+        "avx2": True,
+        "avx512": False,
+        "fma": True,
+        "f16c": True,
     }
+    options_description = {
+        "with_openmp": "Use OpenMP for the CPU backend thread pool",
+        "with_blas": "Use OpenBLAS to speed up prompt processing (matrix multiplications)",
+        "native": "Optimize for the CPU of the build machine (-march=native). Ignores the x86 ISA options",
+        "avx": "Enable AVX instructions (x86 only)",
+        "avx2": "Enable AVX2 instructions (x86 only)",
+        "avx512": "Enable AVX512 instructions (x86 only)",
+        "fma": "Enable FMA instructions (x86 only)",
+        "f16c": "Enable F16C instructions (x86 only)",
+    }
+
+    @property
+    def _cmake_prefix(self):
+        # GGML options were split from LLAMA ones when ggml was moved to its own subdirectory
+        return "GGML" if Version(self.version) >= "b3240" else "LLAMA"
 
     @property
     def _min_cppstd(self):
@@ -54,10 +85,28 @@ class LlamaCppConan(ConanFile):
     def config_options(self):
         if self.settings.os == "Windows":
             del self.options.fPIC
+        if self.settings.arch not in ["x86", "x86_64"]:
+            del self.options.avx
+            del self.options.avx2
+            del self.options.avx512
+            del self.options.fma
+            del self.options.f16c
+        # The OpenMP thread pool of the CPU backend (LLAMA_OPENMP) was introduced in b3078
+        if Version(self.version) < "b3078":
+            del self.options.with_openmp
+        elif self.settings.compiler in ["clang", "apple-clang"]:
+            # clang does not ship an OpenMP runtime, only depend on llvm-openmp when asked to
+            self.options.with_openmp = False
 
     def configure(self):
         if self.options.shared:
             self.options.rm_safe("fPIC")
+        if self.options.native:
+            self.options.rm_safe("avx")
+            self.options.rm_safe("avx2")
+            self.options.rm_safe("avx512")
+            self.options.rm_safe("fma")
+            self.options.rm_safe("f16c")
 
     def validate(self):
         if self.settings.compiler.cppstd:
@@ -67,6 +116,8 @@ class LlamaCppConan(ConanFile):
             raise ConanInvalidConfiguration(
                 f"{self.ref} requires {str(self.settings.compiler)}>={minimum_version}."
             )
+        if self.options.native and cross_building(self):
+            raise ConanInvalidConfiguration(f"{self.ref} can not be built with native=True when cross-building")
 
     def layout(self):
         cmake_layout(self, src_folder="src")
@@ -74,6 +125,10 @@ class LlamaCppConan(ConanFile):
     def requirements(self):
         if self.options.with_curl:
             self.requires("libcurl/[>=7.78 <9]")
+        if self.options.with_blas:
+            self.requires("openblas/0.3.27")
+        if self.options.get_safe("with_openmp") and self.settings.compiler in ["clang", "apple-clang"]:
+            self.requires("llvm-openmp/17.0.6")
 
     def source(self):
         get(self, **self.conan_data["sources"][self.version], strip_root=True)
@@ -88,9 +143,20 @@ class LlamaCppConan(ConanFile):
         tc.variables["LLAMA_BUILD_EXAMPLES"] = self.options.get_safe("with_examples")
         tc.variables["LLAMA_CURL"] = self.options.get_safe("with_curl")
         tc.variables["BUILD_SHARED_LIBS"] = bool(self.options.shared)
-        tc.variables["GGML_CUDA"] = self.options.get_safe("with_cuda")
-        if hasattr(self, "settings_build") and cross_building(self):
-            tc.variables["LLAMA_NATIVE"] = False
+        prefix = self._cmake_prefix
+        tc.variables[f"{prefix}_CUDA"] = self.options.get_safe("with_cuda")
+        if self.options.get_safe("with_openmp") is not None:
+            tc.variables[f"{prefix}_OPENMP"] = self.options.with_openmp
+        tc.variables[f"{prefix}_BLAS"] = self.options.with_blas
+        if self.options.with_blas:
+            tc.variables[f"{prefix}_BLAS_VENDOR"] = "OpenBLAS"
+            # Avoid the pkg-config lookup of cblas.h done by upstream when not set
+            openblas_includedir = os.path.join(self.dependencies["openblas"].package_folder, "include", "openblas")
+            tc.variables["BLAS_INCLUDE_DIRS"] = openblas_includedir.replace("\\", "/")
+        tc.variables[f"{prefix}_NATIVE"] = self.options.native
+        for isa in ["avx", "avx2", "avx512", "fma", "f16c"]:
+            if self.options.get_safe(isa) is not None:
+                tc.variables[f"{prefix}_{isa.upper()}"] = self.options.get_safe(isa)
         tc.generate()
 
     def build(self):
@@ -133,4 +199,11 @@ class LlamaCppConan(ConanFile):
         if is_apple_os(self):
             self.cpp_info.components["common"].frameworks.extend(["Foundation", "Accelerate", "Metal"])
         elif self.settings.os in ("Linux", "FreeBSD"):
-            self.cpp_info.components["common"].system_libs.extend(["dl", "m", "pthread", "gomp"])
+            self.cpp_info.components["common"].system_libs.extend(["dl", "m", "pthread"])
+            if self.options.get_safe("with_openmp") and self.settings.compiler == "gcc":
+                self.cpp_info.components["common"].system_libs.append("gomp")
+        for component in ["llama", "common"]:
+            if self.options.with_blas:
+                self.cpp_info.components[component].requires.append("openblas::openblas")
+            if self.options.get_safe("with_openmp") and self.settings.compiler in ["clang", "apple-clang"]:
+                self.cpp_info.components[component].requires.append("llvm-openmp::llvm-openmp")
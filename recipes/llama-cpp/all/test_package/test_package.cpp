@@ -1,8 +1,49 @@
 #include "llama.h"
+#include "ggml.h"
+
+#include <chrono>
 #include <iostream>
+#include <thread>
+
+// Time a f32 matrix multiplication on the CPU backend, which is what the
+// OpenMP, BLAS and ISA options of the recipe affect.
+static void benchmark_mul_mat(int n, int iterations) {
+  ggml_init_params init_params = {
+    /* .mem_size   = */ 64 * 1024 * 1024,
+    /* .mem_buffer = */ nullptr,
+    /* .no_alloc   = */ false,
+  };
+  ggml_context * ctx = ggml_init(init_params);
+
+  ggml_tensor * a = ggml_new_tensor_2d(ctx, GGML_TYPE_F32, n, n);
+  ggml_tensor * b = ggml_new_tensor_2d(ctx, GGML_TYPE_F32, n, n);
+  ggml_set_f32(a, 0.5f);
+  ggml_set_f32(b, 2.0f);
+  ggml_tensor * c = ggml_mul_mat(ctx, a, b);
+
+  ggml_cgraph * graph = ggml_new_graph(ctx);
+  ggml_build_forward_expand(graph, c);
+
+  const int n_threads = static_cast<int>(std::thread::hardware_concurrency());
+  const auto start = std::chrono::steady_clock::now();
+  for (int i = 0; i < iterations; ++i) {
+    ggml_graph_compute_with_ctx(ctx, graph, n_threads > 0 ? n_threads : 1);
+  }
+  const std::chrono::duration<double> elapsed = std::chrono::steady_clock::now() - start;
+
+  const double flops = 2.0 * n * n * n * iterations;
+  std::cout << "mul_mat " << n << "x" << n << ": " << flops / elapsed.count() / 1e9
+            << " GFLOP/s (" << n_threads << " threads, result " << ggml_get_f32_1d(c, 0) << ")" << std::endl;
+
+  ggml_free(ctx);
+}
+
 int main() {
   llama_model_params params = llama_model_default_params();
   std::cout << "Main GPU: " << params.main_gpu << std::endl;
+  std::cout << "System info: " << llama_print_system_info() << std::endl;
+
+  benchmark_mul_mat(512, 10);
 
   return 0;
 }
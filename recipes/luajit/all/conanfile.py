@@ -6,6 +6,7 @@ from conan.tools.layout import basic_layout
 from conan.tools.gnu import Autotools, AutotoolsToolchain
 from conan.tools.apple import is_apple_os
 from conan.tools.build import cross_building
+from conan.tools.env import Environment
 from conan.errors import ConanInvalidConfiguration
 import os
 
@@ -22,8 +23,37 @@ class LuajitConan(ConanFile):
     topics = ("lua", "jit")
     provides = "lua"
     settings = "os", "arch", "compiler", "build_type"
-    options = {"shared": [True, False], "fPIC": [True, False]}
-    default_options = {"shared": False, "fPIC": True}
+    options = {
+        "shared": [True, False],
+        "fPIC": [True, False],
+        "gc64": [True, False],
+        "disable_jit": [True, False],
+        "disable_ffi": [True, False],
+        "nummode": [None, 1, 2],
+        "use_sysmalloc": [True, False],
+        "lua52compat": [True, False],
+        "use_assert": [True, False],
+    }
+    default_options = {
+        "shared": False,
+        "fPIC": True,
+        "gc64": False,
+        "disable_jit": False,
+        "disable_ffi": False,
+        "nummode": None,
+        "use_sysmalloc": False,
+        "lua52compat": False,
+        "use_assert": False,
+    }
+    options_description = {
+        "gc64": "64 bit GC references (LUAJIT_ENABLE_GC64), lifts the 2GB heap limit",
+        "disable_jit": "Interpreter only build (LUAJIT_DISABLE_JIT)",
+        "disable_ffi": "Disable the FFI extension (LUAJIT_DISABLE_FFI)",
+        "nummode": "Number mode (LUAJIT_NUMMODE): 1 for all number ops as floating point, 2 for dual-number mode",
+        "use_sysmalloc": "Use the system allocator instead of the bundled one (LUAJIT_USE_SYSMALLOC)",
+        "lua52compat": "Enable the Lua 5.2 compatible features (LUAJIT_ENABLE_LUA52COMPAT)",
+        "use_assert": "Enable internal assertions and Lua/C API checks (LUA_USE_ASSERT, LUA_USE_APICHECK)",
+    }
 
     def export_sources(self):
         export_conandata_patches(self)
@@ -31,6 +61,9 @@ class LuajitConan(ConanFile):
     def config_options(self):
         if self.settings.os == "Windows":
             del self.options.fPIC
+        if self.settings.arch != "x86_64":
+            # GC64 is always used on arm64 and not available on 32 bit targets
+            del self.options.gc64
 
     def configure(self):
         if self.options.shared:
@@ -46,17 +79,54 @@ class LuajitConan(ConanFile):
             raise ConanInvalidConfiguration(f"{self.ref} can not be cross-built to Mac M1. Please, try any version >=2.1")
         elif Version(self.version) <= "2.1.0-beta1" and self.settings.os == "Macos" and self.settings.arch == "armv8":
             raise ConanInvalidConfiguration(f"{self.ref} is not supported by Mac M1. Please, try any version >=2.1")
+        if self.options.use_sysmalloc and self.settings.arch == "x86_64" and not self.options.gc64:
+            # The system allocator can not guarantee the low 2GB addresses required without GC64 on x64
+            raise ConanInvalidConfiguration(f"{self.ref} requires -o {self.name}/*:gc64=True to use the system allocator on x86_64")
+        if is_msvc(self) and (self.options.disable_jit or self.options.disable_ffi or self.options.nummode):
+            # msvcbuild.bat hardcodes the DynASM flags of the VM, which must match these settings
+            raise ConanInvalidConfiguration(f"{self.ref} options disable_jit, disable_ffi and nummode are not supported with msvc")
 
     def source(self):
         filename = f"LuaJIT-{self.version}.tar.gz"
         get(self, **self.conan_data["sources"][self.version], destination=self.source_folder, filename=filename, strip_root=True)
 
+    @property
+    def _defines(self):
+        defines = []
+        if self.options.get_safe("gc64"):
+            defines.append("LUAJIT_ENABLE_GC64")
+        if self.options.disable_jit:
+            defines.append("LUAJIT_DISABLE_JIT")
+        if self.options.disable_ffi:
+            defines.append("LUAJIT_DISABLE_FFI")
+        if self.options.nummode:
+            defines.append(f"LUAJIT_NUMMODE={self.options.nummode}")
+        if self.options.use_sysmalloc:
+            defines.append("LUAJIT_USE_SYSMALLOC")
+        if self.options.lua52compat:
+            defines.append("LUAJIT_ENABLE_LUA52COMPAT")
+        if self.options.use_assert:
+            defines.extend(self._assert_defines)
+        return defines
+
+    @property
+    def _assert_defines(self):
+        # internal checks of the library, not meant for consumers
+        return ["LUA_USE_ASSERT", "LUA_USE_APICHECK"]
+
     def generate(self):
         if is_msvc(self):
             tc = MSBuildToolchain(self)
             tc.generate()
             tc = VCVars(self)
             tc.generate()
+            # msvcbuild.bat has no way to pass extra flags, cl.exe reads them from the CL environment variable.
+            # GC64 is passed as an argument of msvcbuild.bat, since the VM must be built accordingly.
+            defines = [define for define in self._defines if define != "LUAJIT_ENABLE_GC64"]
+            if defines:
+                env = Environment()
+                env.append("CL", [f"/D{define}" for define in defines])
+                env.vars(self).save_script("conanbuild_luajit_defines")
         else:
             tc = AutotoolsToolchain(self)
             tc.generate()
@@ -95,6 +165,9 @@ class LuajitConan(ConanFile):
         args = [f"PREFIX={unix_path(self, self.package_folder)}"]
         if is_apple_os(self) and self._macosx_deployment_target:
             args.append(f"MACOSX_DEPLOYMENT_TARGET={self._macosx_deployment_target}")
+        if self._defines:
+            xcflags = " ".join(f"-D{define}" for define in self._defines)
+            args.append(f'XCFLAGS="{xcflags}"')
         return args
 
     @property
@@ -110,6 +183,9 @@ class LuajitConan(ConanFile):
         if is_msvc(self):
             with chdir(self, os.path.join(self.source_folder, "src")):
                 variant = '' if self.options.shared else 'static'
+                if self.options.get_safe("gc64"):
+                    # msvcbuild.bat expects gc64 as first argument
+                    variant = f"gc64 {variant}"
                 self.run(f"msvcbuild.bat {variant}", env="conanbuild")
         else:
             with chdir(self, self.source_folder):
@@ -140,5 +216,6 @@ class LuajitConan(ConanFile):
         self.cpp_info.libs = ["lua51" if is_msvc(self) else "luajit-5.1"]
         self.cpp_info.set_property("pkg_config_name", "luajit")
         self.cpp_info.includedirs = [os.path.join("include", self._luajit_include_folder)]
+        self.cpp_info.defines = [define for define in self._defines if define not in self._assert_defines]
         if self.settings.os in ["Linux", "FreeBSD"]:
             self.cpp_info.system_libs.extend(["m", "dl"])
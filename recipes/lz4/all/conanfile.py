@@ -21,10 +21,21 @@ class LZ4Conan(ConanFile):
     options = {
         "shared": [True, False],
         "fPIC": [True, False],
+        "build_programs": [True, False],
+        "memory_usage": [None] + list(range(10, 21)),
+        "heapmode": [True, False],
     }
     default_options = {
         "shared": False,
         "fPIC": True,
+        "build_programs": False,
+        "memory_usage": None,
+        "heapmode": False,
+    }
+    options_description = {
+        "build_programs": "Build and package the lz4 command line tool",
+        "memory_usage": "LZ4_MEMORY_USAGE: log2 of the hash table size in bytes (upstream default is 14, i.e. 16 KiB)",
+        "heapmode": "LZ4_HEAPMODE: allocate the compression state on the heap instead of the stack",
     }
 
     def export_sources(self):
@@ -49,7 +60,7 @@ class LZ4Conan(ConanFile):
 
     def generate(self):
         tc = CMakeToolchain(self)
-        tc.variables["LZ4_BUILD_CLI"] = False
+        tc.variables["LZ4_BUILD_CLI"] = self.options.build_programs
         if Version(self.version) < "1.10.0":
             tc.variables["LZ4_BUILD_LEGACY_LZ4C"] = False
         tc.variables["LZ4_BUNDLED_MODE"] = False
@@ -58,8 +69,19 @@ class LZ4Conan(ConanFile):
         tc.cache_variables["CMAKE_POLICY_DEFAULT_CMP0042"] = "NEW"
         # Honor BUILD_SHARED_LIBS (see https://github.com/conan-io/conan/issues/11840)
         tc.cache_variables["CMAKE_POLICY_DEFAULT_CMP0077"] = "NEW"
+        for define, value in self._tuning_defines.items():
+            tc.preprocessor_definitions[define] = value
         tc.generate()
 
+    @property
+    def _tuning_defines(self):
+        defines = {}
+        if self.options.memory_usage:
+            defines["LZ4_MEMORY_USAGE"] = str(self.options.memory_usage)
+        if self.options.heapmode:
+            defines["LZ4_HEAPMODE"] = "1"
+        return defines
+
     @property
     def _cmakelists_folder(self):
         subfolder = os.path.join("build", "cmake")
@@ -113,6 +135,11 @@ class LZ4Conan(ConanFile):
         self.cpp_info.libs = ["lz4"]
         if is_msvc(self) and self.options.shared:
             self.cpp_info.defines.append("LZ4_DLL_IMPORT=1")
+        # LZ4_MEMORY_USAGE changes the size of the public LZ4_stream_t, consumers must see the same value
+        self.cpp_info.defines.extend(f"{define}={value}" for define, value in self._tuning_defines.items())
+        # TODO: to remove in conan v2
+        if self.options.build_programs:
+            self.env_info.PATH.append(os.path.join(self.package_folder, "bin"))
 
         # TODO: to remove in conan v2 once legacy generators removed
         self.cpp_info.build_modules["cmake_find_package"] = [self._module_file_rel_path]
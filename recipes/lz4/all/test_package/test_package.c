@@ -9,5 +9,6 @@ int main(int argc, char** argv)
 {
 	(void)argc; (void)argv;
     printf("Hello World ! LZ4 Library version = %d\n", LZ4_versionNumber());
+    printf("LZ4_MEMORY_USAGE = %d\n", LZ4_MEMORY_USAGE);
     return 0;
 }
@@ -1,11 +1,12 @@
 from conan import ConanFile
-from conan.errors import ConanInvalidConfiguration
+from conan.errors import ConanException, ConanInvalidConfiguration
 from conan.tools.cmake import CMake, CMakeToolchain, cmake_layout
-from conan.tools.files import apply_conandata_patches, export_conandata_patches, get, copy, rm, rmdir, replace_in_file, collect_libs
+from conan.tools.files import apply_conandata_patches, export_conandata_patches, get, copy, load, rm, rmdir, replace_in_file, save, collect_libs
 from conan.tools.microsoft import is_msvc, is_msvc_static_runtime, VCVars
 from conan.tools.env import VirtualBuildEnv
 from conan.tools.scm import Version
 import os
+import re
 import shutil
 
 required_conan_version = ">=2"
@@ -27,6 +28,12 @@ class MimallocConan(ConanFile):
         "override": [True, False],
         "inject": [True, False],
         "single_object": [True, False],
+        "no_padding": [True, False],
+        "debug_level": [None, 0, 1, 2, 3],
+        "skip_collect_on_exit": [True, False],
+        "local_dynamic_tls": [True, False],
+        "option_reserve_huge_os_pages": [None, "ANY"],
+        "option_large_os_pages": [True, False],
     }
     default_options = {
         "shared": False,
@@ -35,7 +42,27 @@ class MimallocConan(ConanFile):
         "override": False,
         "inject": False,
         "single_object": False,
+        "no_padding": False,
+        "debug_level": None,
+        "skip_collect_on_exit": False,
+        "local_dynamic_tls": False,
+        "option_reserve_huge_os_pages": None,
+        "option_large_os_pages": False,
     }
+    options_description = {
+        "no_padding": "Never pad heap blocks, even in debug or secure builds (MI_NO_PADDING)",
+        "debug_level": "Internal assertion level (MI_DEBUG), defaults to 2 in debug builds and 0 otherwise",
+        "skip_collect_on_exit": "Skip collecting memory on program exit (MI_SKIP_COLLECT_ON_EXIT)",
+        "local_dynamic_tls": "Use the slower, dlopen-compatible TLS model (MI_LOCAL_DYNAMIC_TLS)",
+        "option_reserve_huge_os_pages": "Default of mi_option_reserve_huge_os_pages: number of 1GiB huge pages reserved at startup",
+        "option_large_os_pages": "Default of mi_option_large_os_pages: use 2MiB large OS pages when available",
+    }
+
+    @property
+    def _has_exit_and_padding_options(self):
+        # MI_NO_PADDING and MI_SKIP_COLLECT_ON_EXIT were added in 1.8.2 and 2.1.2
+        version = Version(self.version)
+        return version >= "2.1.2" or "1.8.2" <= version < "2.0"
 
     def export_sources(self):
         export_conandata_patches(self)
@@ -50,6 +77,12 @@ class MimallocConan(ConanFile):
             del self.options.single_object
             del self.options.inject
 
+        if self.settings.os == "Windows":
+            del self.options.local_dynamic_tls
+        if not self._has_exit_and_padding_options:
+            del self.options.no_padding
+            del self.options.skip_collect_on_exit
+
     def configure(self):
         if self.options.shared:
             self.options.rm_safe("fPIC")
@@ -94,6 +127,11 @@ class MimallocConan(ConanFile):
            self.options.get_safe("inject"):
             raise ConanInvalidConfiguration("Single object is incompatible with library injection")
 
+        reserve_huge_os_pages = self.options.option_reserve_huge_os_pages
+        if reserve_huge_os_pages != None and not str(reserve_huge_os_pages).isdigit():
+            raise ConanInvalidConfiguration(
+                f"option_reserve_huge_os_pages must be a number of 1GiB pages, got '{reserve_huge_os_pages}'")
+
     def build_requirements(self):
         self.tool_requires("cmake/[>=3.18 <4]")
 
@@ -110,6 +148,13 @@ class MimallocConan(ConanFile):
         tc.variables["MI_SECURE"] = "ON" if self.options.secure else "OFF"
         tc.variables["MI_WIN_REDIRECT"] = "OFF"
         tc.variables["MI_INSTALL_TOPLEVEL"] = "ON"
+        if "no_padding" in self.options:
+            tc.variables["MI_NO_PADDING"] = "ON" if self.options.no_padding else "OFF"
+            tc.variables["MI_SKIP_COLLECT_ON_EXIT"] = "ON" if self.options.skip_collect_on_exit else "OFF"
+        if "local_dynamic_tls" in self.options:
+            tc.variables["MI_LOCAL_DYNAMIC_TLS"] = "ON" if self.options.local_dynamic_tls else "OFF"
+        if self.options.debug_level != None:
+            tc.preprocessor_definitions["MI_DEBUG"] = str(self.options.debug_level)
         tc.generate()
         venv = VirtualBuildEnv(self)
         venv.generate(scope="build")
@@ -124,10 +169,31 @@ class MimallocConan(ConanFile):
             replace_in_file(self, os.path.join(self.source_folder, "CMakeLists.txt"),
                             "mimalloc-redirect.lib",
                             "mimalloc-redirect32.lib")
+        self._patch_option_defaults()
         cmake = CMake(self)
         cmake.configure()
         cmake.build()
 
+    def _patch_option_defaults(self):
+        # Names of the entries in the options table of src/options.c,
+        # large_os_pages is still declared under its legacy name in some versions
+        option_defaults = {
+            "reserve_huge_os_pages": ("reserve_huge_os_pages", self.options.option_reserve_huge_os_pages),
+            "allow_large_os_pages|large_os_pages": ("large_os_pages", 1 if self.options.option_large_os_pages else None),
+        }
+        if all(value == None for _, value in option_defaults.values()):
+            return
+        options_c = os.path.join(self.source_folder, "src", "options.c")
+        content = load(self, options_c)
+        for names, (name, value) in option_defaults.items():
+            if value == None:
+                continue
+            content, count = re.subn(rf"(\{{\s*)[^,{{}}]+(\s*,\s*UNINIT\s*,\s*MI_OPTION(?:_LEGACY)?\(\s*(?:{names})\s*[,)])",
+                                     rf"\g<1>{value}\g<2>", content)
+            if count != 1:
+                raise ConanException(f"Could not find the default of mi_option_{name} in {options_c}")
+        save(self, options_c, content)
+
     def package(self):
         copy(self, pattern="LICENSE", dst=os.path.join(self.package_folder, "licenses"), src=self.source_folder)
         cmake = CMake(self)
@@ -2,10 +2,76 @@
 
 #include <stdlib.h>
 #include <stdio.h>
+#include <time.h>
+
+#ifdef _WIN32
+#include <windows.h>
+#else
+#include <pthread.h>
+#endif
+
+#define NUM_THREADS 4
+#define NUM_ITERATIONS 100000
+#define NUM_SLOTS 256
+
+static void *alloc_free_loop(void *arg) {
+    void *slots[NUM_SLOTS] = {0};
+    unsigned int seed = (unsigned int)(size_t)arg;
+
+    for (int i = 0; i < NUM_ITERATIONS; ++i) {
+        seed = seed * 1103515245u + 12345u;
+        size_t slot = (seed >> 8) % NUM_SLOTS;
+        size_t size = 16 + ((seed >> 16) % 1024);
+        mi_free(slots[slot]);
+        slots[slot] = mi_malloc(size);
+    }
+    for (int i = 0; i < NUM_SLOTS; ++i) {
+        mi_free(slots[i]);
+    }
+    return NULL;
+}
+
+#ifdef _WIN32
+static DWORD WINAPI thread_entry(LPVOID arg) {
+    alloc_free_loop(arg);
+    return 0;
+}
+#endif
+
+static double run_threads(void) {
+    clock_t start = clock();
+#ifdef _WIN32
+    HANDLE threads[NUM_THREADS];
+    for (size_t i = 0; i < NUM_THREADS; ++i) {
+        threads[i] = CreateThread(NULL, 0, thread_entry, (LPVOID)(i + 1), 0, NULL);
+    }
+    WaitForMultipleObjects(NUM_THREADS, threads, TRUE, INFINITE);
+    for (size_t i = 0; i < NUM_THREADS; ++i) {
+        CloseHandle(threads[i]);
+    }
+#else
+    pthread_t threads[NUM_THREADS];
+    for (size_t i = 0; i < NUM_THREADS; ++i) {
+        pthread_create(&threads[i], NULL, alloc_free_loop, (void *)(i + 1));
+    }
+    for (size_t i = 0; i < NUM_THREADS; ++i) {
+        pthread_join(threads[i], NULL);
+    }
+#endif
+    // CPU time of the whole process, summed over all threads
+    return (double)(clock() - start) / CLOCKS_PER_SEC;
+}
 
 int main() {
     void *data = mi_malloc(32);
 
     printf("mimalloc version %d\n", mi_version());
+    printf("mi_option_reserve_huge_os_pages: %ld\n", mi_option_get(mi_option_reserve_huge_os_pages));
+    printf("mi_option_large_os_pages: %ld\n", mi_option_get(mi_option_large_os_pages));
+
+    double seconds = run_threads();
+    printf("%d threads x %d alloc/free pairs: %.3f s cpu\n", NUM_THREADS, NUM_ITERATIONS, seconds);
+
+    mi_free(data);
     return EXIT_SUCCESS;
 }
@@ -2,10 +2,11 @@ from conan import ConanFile
 from conan.errors import ConanInvalidConfiguration
 from conan.tools.apple import is_apple_os
 from conan.tools.cmake import CMake, CMakeDeps, CMakeToolchain, cmake_layout
-from conan.tools.files import apply_conandata_patches, copy, export_conandata_patches, get, rmdir, replace_in_file
+from conan.tools.files import apply_conandata_patches, copy, export_conandata_patches, get, load, rmdir, replace_in_file
 from conan.tools.build import check_min_cppstd
 from conan.tools.scm import Version
 from conan.tools.env import VirtualBuildEnv
+import hashlib
 import os
 import sys
 
@@ -28,12 +29,25 @@ class OnnxRuntimeConan(ConanFile):
         "fPIC": [True, False],
         "with_xnnpack": [True, False],
         "with_cuda": [True, False],
+        "enable_cpu_fp16_ops": [True, False],
+        "minimal_build": [True, False],
+        "reduced_ops_config": [None, "ANY"],
     }
     default_options = {
         "shared": False,
         "fPIC": True,
         "with_xnnpack": False,
         "with_cuda": False,
+        "enable_cpu_fp16_ops": False,
+        "minimal_build": False,
+        "reduced_ops_config": None,
+    }
+    options_description = {
+        "enable_cpu_fp16_ops": "Build the float16 CPU kernels",
+        "minimal_build": "Minimal build, which can only load models in ORT format",
+        "reduced_ops_config": "Absolute path to an operators config file (as generated by create_reduced_build_config.py) "
+                              "used to only build the kernels of the listed operators. The file must exist on every "
+                              "machine resolving the package, the package_id is derived from its contents, not its path",
     }
     short_paths = True
 
@@ -113,7 +127,21 @@ class OnnxRuntimeConan(ConanFile):
         if self.options.with_cuda:
             self.requires("cutlass/3.5.0")
 
+    def package_id(self):
+        # The option value is a host path: identify the binary by the contents of the config file instead,
+        # missing files are reported by validate()
+        config = self.info.options.reduced_ops_config
+        if config and os.path.isfile(str(config)):
+            digest = hashlib.sha256(load(self, str(config)).encode()).hexdigest()
+            self.info.options.reduced_ops_config = f"sha256:{digest}"
+
     def validate(self):
+        if self.options.reduced_ops_config:
+            config = str(self.options.reduced_ops_config)
+            if not os.path.isabs(config):
+                raise ConanInvalidConfiguration(f"reduced_ops_config must be an absolute path, got '{config}'")
+            if not os.path.isfile(config):
+                raise ConanInvalidConfiguration(f"The reduced_ops_config file '{config}' does not exist.")
         if self.settings.compiler.get_safe("cppstd"):
             check_min_cppstd(self, self._min_cppstd)
         minimum_version = self._compilers_minimum_version.get(str(self.settings.compiler), False)
@@ -163,7 +191,9 @@ class OnnxRuntimeConan(ConanFile):
 
         tc.variables["onnxruntime_ARMNN_RELU_USE_CPU"] = False
         tc.variables["onnxruntime_ARMNN_BN_USE_CPU"] = False
-        tc.variables["onnxruntime_ENABLE_CPU_FP16_OPS"] = False
+        tc.variables["onnxruntime_ENABLE_CPU_FP16_OPS"] = self.options.enable_cpu_fp16_ops
+        tc.variables["onnxruntime_MINIMAL_BUILD"] = self.options.minimal_build
+        tc.variables["onnxruntime_REDUCED_OPS_BUILD"] = bool(self.options.reduced_ops_config)
         tc.variables["onnxruntime_ENABLE_EAGER_MODE"] = False
         tc.variables["onnxruntime_ENABLE_LAZY_TENSOR"] = False
 
@@ -199,8 +229,18 @@ class OnnxRuntimeConan(ConanFile):
                             'option(onnxruntime_NVCC_THREADS "Number of threads that NVCC can use for compilation." 1)', 
                             'set(onnxruntime_NVCC_THREADS "1" CACHE STRING "Number of threads that NVCC can use for compilation.")')
 
+    def _reduce_op_kernels(self):
+        # Same as the --include_ops_by_config argument of upstream build.py: the kernel registration
+        # sources are rewritten into the build folder, and used instead of the original ones when
+        # onnxruntime_REDUCED_OPS_BUILD is enabled
+        script = os.path.join(self.source_folder, "tools", "ci_build", "reduce_op_kernels.py")
+        config = str(self.options.reduced_ops_config)
+        self.run(f'"{sys.executable}" "{script}" --cmake_build_dir "{self.build_folder}" "{config}"')
+
     def build(self):
         self._patch_sources()
+        if self.options.reduced_ops_config:
+            self._reduce_op_kernels()
         cmake = CMake(self)
         # https://github.com/microsoft/onnxruntime/blob/v1.14.1/cmake/CMakeLists.txt#L792
         # onnxruntime is builds its targets with COMPILE_WARNING_AS_ERROR ON
@@ -73,7 +73,10 @@ class OpenblasConan(ConanFile):
         "fPIC": [True, False],
         "build_lapack": [True, False],
         "build_relapack": [True, False],
-        "use_thread": [True, False],
+        "use_thread": [True, False, "deprecated"],
+        "threading": ["pthreads", "openmp", "none"],
+        "num_threads": [None, "ANY"],
+        "buffer_size": [None, "ANY"],
         "use_locking": [True, False],
         "dynamic_arch": [True, False],
         "target": [None] + available_openblas_targets
@@ -83,7 +86,10 @@ class OpenblasConan(ConanFile):
         "fPIC": True,
         "build_lapack": True,
         "build_relapack": False,
-        "use_thread": True,
+        "use_thread": "deprecated",
+        "threading": "pthreads",
+        "num_threads": None,
+        "buffer_size": None,
         "use_locking": True,
         "dynamic_arch": False,
         "target": None,
@@ -91,7 +97,10 @@ class OpenblasConan(ConanFile):
     options_description = {
         "build_lapack": "Build LAPACK and LAPACKE",
         "build_relapack": "Build with ReLAPACK (recursive implementation of several LAPACK functions on top of standard LAPACK)",
-        "use_thread": "Enable threads support",
+        "use_thread": "Deprecated, use threading instead",
+        "threading": "Threading back-end: pthreads, OpenMP or single-threaded",
+        "num_threads": "Maximum number of threads (NUM_THREADS). Defaults to the number of cores of the build machine",
+        "buffer_size": "Log2 of the memory buffer size used by each thread (BUFFERSIZE), e.g. 25 for 32 MiB",
         "use_locking": "Use locks even in single-threaded builds to make them callable from multiple threads",
         "dynamic_arch": "Include support for multiple CPU targets, with automatic selection at runtime (x86/x86_64, aarch64 or ppc only)",
         "target": "OpenBLAS TARGET variable (see TargetList.txt)",
@@ -118,6 +127,10 @@ class OpenblasConan(ConanFile):
         if self.options.shared:
             self.options.rm_safe("fPIC")
 
+        if self.options.use_thread != "deprecated":
+            self.output.warning("use_thread option is deprecated, use threading option instead.")
+            self.options.threading = "pthreads" if self.options.use_thread else "none"
+
         # When cross-compiling, OpenBLAS requires explicitly setting TARGET
         if cross_building(self, skip_x64_x86=True) and not self.options.target:
             # Try inferring the target from settings.arch
@@ -126,7 +139,19 @@ class OpenblasConan(ConanFile):
                 self.output.warning(f'Setting OpenBLAS TARGET={target} based on settings.arch. This may result in suboptimal performance. Set the "{self.name}/*:target=XXX" option to silence this warning.')
                 self.options.target = target
 
+    def requirements(self):
+        if self.options.threading == "openmp" and self.settings.compiler in ["clang", "apple-clang"]:
+            self.requires("llvm-openmp/17.0.6", transitive_headers=True, transitive_libs=True)
+
+    def package_id(self):
+        del self.info.options.use_thread
+
     def validate(self):
+        for option in ["num_threads", "buffer_size"]:
+            value = self.options.get_safe(option)
+            if value and (not str(value).isdigit() or int(value) == 0):
+                raise ConanInvalidConfiguration(f'"{self.name}/*:{option}" option must be a positive integer')
+
         if Version(self.version) < "0.3.24" and self.settings.arch == "armv8":
             # OpenBLAS fails to detect the appropriate target architecture for armv8 for versions < 0.3.24, as it matches the 32 bit variant instead of 64.
             # This was fixed in https://github.com/OpenMathLib/OpenBLAS/pull/4142, which was introduced in 0.3.24.
@@ -177,8 +202,13 @@ class OpenblasConan(ConanFile):
         tc.variables["BUILD_RELAPACK"] = self.options.build_relapack
 
         tc.variables["DYNAMIC_ARCH"] = self.options.dynamic_arch
-        tc.variables["USE_THREAD"] = self.options.use_thread
+        tc.variables["USE_THREAD"] = self.options.threading != "none"
+        tc.variables["USE_OPENMP"] = self.options.threading == "openmp"
         tc.variables["USE_LOCKING"] = self.options.use_locking
+        if self.options.num_threads:
+            tc.variables["NUM_THREADS"] = int(self.options.num_threads)
+        if self.options.buffer_size:
+            tc.variables["BUFFERSIZE"] = int(self.options.buffer_size)
 
         tc.variables["MSVC_STATIC_CRT"] = is_msvc_static_runtime(self)
 
@@ -253,22 +283,29 @@ class OpenblasConan(ConanFile):
         # CMake config file:
         # - OpenBLAS always has one and only one of these components: openmp, pthread or serial.
         # - Whatever if this component is requested or not, official CMake imported target is always OpenBLAS::OpenBLAS
-        # - TODO: add openmp component when implemented in this recipe
         self.cpp_info.set_property("cmake_file_name", "OpenBLAS")
         self.cpp_info.set_property("cmake_target_name", "OpenBLAS::OpenBLAS")
         self.cpp_info.set_property("pkg_config_name", "openblas")
         # 'pthread' causes issues without namespace
-        cmake_component_name = "pthread" if self.options.use_thread else "serial"  # TODO: how to model this in CMakeDeps?
+        cmake_component_name = {
+            "pthreads": "pthread",
+            "openmp": "openmp",
+            "none": "serial",
+        }[str(self.options.threading)]  # TODO: how to model this in CMakeDeps?
         self.cpp_info.components["openblas_component"].set_property("cmake_target_name", f"OpenBLAS::{cmake_component_name}")
         self.cpp_info.components["openblas_component"].set_property("pkg_config_name", "openblas")
         self.cpp_info.components["openblas_component"].includedirs.append(os.path.join("include", "openblas"))
         self.cpp_info.components["openblas_component"].libs = [self._lib_name]
         if self.settings.os in ["Linux", "FreeBSD"]:
             self.cpp_info.components["openblas_component"].system_libs.append("m")
-            if self.options.use_thread:
+            if self.options.threading != "none":
                 self.cpp_info.components["openblas_component"].system_libs.append("pthread")
+            if self.options.threading == "openmp" and self.settings.compiler == "gcc":
+                self.cpp_info.components["openblas_component"].system_libs.append("gomp")
             if self.options.build_lapack and self._fortran_compiler:
                 self.cpp_info.components["openblas_component"].system_libs.append("gfortran")
+        if self.options.threading == "openmp" and self.settings.compiler in ["clang", "apple-clang"]:
+            self.cpp_info.components["openblas_component"].requires.append("llvm-openmp::llvm-openmp")
 
         self.buildenv_info.define_path("OpenBLAS_HOME", self.package_folder)
         self.runenv_info.define_path("OpenBLAS_HOME", self.package_folder)
@@ -32,6 +32,8 @@ class OpenSSLConan(ConanFile):
         "capieng_dialog": [True, False],
         "enable_capieng": [True, False],
         "enable_trace": [True, False],
+        "enable_ktls": [True, False],
+        "enable_ec_nistp_64_gcc_128": [True, False],
         "no_aria": [True, False],
         "no_apps": [True, False],
         "no_autoload_config": [True, False],
@@ -120,6 +122,13 @@ class OpenSSLConan(ConanFile):
         else:
             self.options.rm_safe("fPIC")
 
+        if self.settings.os not in ["Linux", "FreeBSD"]:
+            # kernel TLS offload
+            self.options.rm_safe("enable_ktls")
+        if self._use_nmake or self.settings.arch not in ["x86_64", "armv8", "ppc64le", "riscv64"]:
+            # requires __uint128_t on a 64-bit little-endian target
+            self.options.rm_safe("enable_ec_nistp_64_gcc_128")
+
         if self.settings.os == "Emscripten":
             self.options.no_asm = True
             self.options.no_threads = True
@@ -128,6 +137,8 @@ class OpenSSLConan(ConanFile):
     def configure(self):
         if self.options.shared:
             self.options.rm_safe("fPIC")
+        if self.options.no_asm and self.settings.os != "Emscripten":
+            self.output.warning("openssl:no_asm=True disables the AES-NI, AVX2/AVX512 and ARMv8 crypto code paths")
         self.settings.rm_safe("compiler.libcxx")
         self.settings.rm_safe("compiler.cppstd")
 
@@ -387,6 +398,9 @@ class OpenSSLConan(ConanFile):
         if self.options.get_safe("enable_trace"):
             args.append("enable-trace")
 
+        if self.options.get_safe("enable_ec_nistp_64_gcc_128"):
+            args.append("enable-ec_nistp_64_gcc_128")
+
         if self.settings.os == "Neutrino":
             args.append("no-asm -lsocket -latomic")
 
@@ -410,7 +424,7 @@ class OpenSSLConan(ConanFile):
             ])
 
         for option_name in self.default_options.keys():
-            if self.options.get_safe(option_name, False) and option_name not in ("shared", "fPIC", "openssldir", "tls_security_level", "capieng_dialog", "enable_capieng", "zlib", "no_fips", "no_md2"):
+            if self.options.get_safe(option_name, False) and option_name not in ("shared", "fPIC", "openssldir", "tls_security_level", "capieng_dialog", "enable_capieng", "enable_ec_nistp_64_gcc_128", "zlib", "no_fips", "no_md2"):
                 self.output.info(f"Activated option: {option_name}")
                 args.append(option_name.replace("_", "-"))
         return args
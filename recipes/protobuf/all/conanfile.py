@@ -1,13 +1,14 @@
 from conan import ConanFile
-from conan.errors import ConanInvalidConfiguration
+from conan.errors import ConanException, ConanInvalidConfiguration
 from conan.tools.apple import is_apple_os
 from conan.tools.build import check_min_cppstd
 from conan.tools.cmake import CMake, CMakeDeps, CMakeToolchain, cmake_layout
-from conan.tools.files import copy, rename, get, apply_conandata_patches, export_conandata_patches, replace_in_file, rmdir, rm, save
+from conan.tools.files import copy, rename, get, apply_conandata_patches, export_conandata_patches, load, replace_in_file, rmdir, rm, save
 from conan.tools.microsoft import check_min_vs, msvc_runtime_flag, is_msvc, is_msvc_static_runtime
 from conan.tools.scm import Version
 
 import os
+import re
 
 required_conan_version = ">=1.53"
 
@@ -29,6 +30,9 @@ class ProtobufConan(ConanFile):
         "lite": [True, False],
         "upb": [True, False],
         "debug_suffix": [True, False],
+        "runtime": ["full", "lite", "upb"],
+        "arena_start_block_size": [None, "ANY"],
+        "arena_max_block_size": [None, "ANY"],
     }
     default_options = {
         "shared": False,
@@ -38,6 +42,16 @@ class ProtobufConan(ConanFile):
         "lite": False,
         "upb": False,
         "debug_suffix": True,
+        "runtime": "full",
+        "arena_start_block_size": None,
+        "arena_max_block_size": None,
+    }
+    options_description = {
+        "lite": "Also package libprotobuf-lite next to libprotobuf",
+        "upb": "Also package libupb next to libprotobuf",
+        "runtime": "Runtime library exposed to consumers: 'full' (libprotobuf), 'lite' (libprotobuf-lite only) or 'upb' (libupb only, >= 27.0). protoc is packaged in all cases",
+        "arena_start_block_size": "Size in bytes of the first block an Arena allocates when ArenaOptions do not say otherwise (upstream default: 256)",
+        "arena_max_block_size": "Upper bound in bytes of the block size an Arena grows to by default (upstream default: 8192 up to 3.x, 32768 since 4.x)",
     }
 
     short_paths = True
@@ -55,6 +69,14 @@ class ProtobufConan(ConanFile):
         current_ver = Version(self.version)
         return Version(f"{current_ver.minor}.{current_ver.patch}")
 
+    @property
+    def _with_lite(self):
+        return bool(self.options.lite) or self.options.runtime == "lite"
+
+    @property
+    def _with_upb(self):
+        return bool(self.options.get_safe("upb")) or self.options.runtime == "upb"
+
     def export_sources(self):
         export_conandata_patches(self)
         copy(self, "protobuf-conan-protoc-target.cmake", self.recipe_folder, os.path.join(self.export_sources_folder, "src"))
@@ -70,11 +92,15 @@ class ProtobufConan(ConanFile):
         if self._protobuf_release < "27.0":
             self.options.rm_safe("upb")
 
+        if self.options.runtime != "full":
+            # only the gzip streams of libprotobuf use zlib
+            self.options.rm_safe("with_zlib")
+
     def layout(self):
         cmake_layout(self, src_folder="src")
 
     def requirements(self):
-        if self.options.with_zlib:
+        if self.options.get_safe("with_zlib"):
             self.requires("zlib/[>=1.2.11 <2]")
 
         if self._protobuf_release >= "22.0":
@@ -112,6 +138,17 @@ class ProtobufConan(ConanFile):
         
         check_min_vs(self, "190")
 
+        if self.options.runtime == "upb" and self._protobuf_release < "27.0":
+            raise ConanInvalidConfiguration(f"{self.ref} does not ship the upb runtime, use protobuf >= 5.27.0 for runtime=upb")
+
+        for option in ("arena_start_block_size", "arena_max_block_size"):
+            value = self.options.get_safe(option)
+            if value and (not str(value).isdigit() or int(value) == 0):
+                raise ConanInvalidConfiguration(f"{self.ref} option {option} must be a positive number of bytes")
+        if self.options.arena_start_block_size and self.options.arena_max_block_size and \
+           int(self.options.arena_start_block_size) > int(self.options.arena_max_block_size):
+            raise ConanInvalidConfiguration(f"{self.ref} arena_start_block_size can't be greater than arena_max_block_size")
+
         if self.settings.compiler == "clang":
             if Version(self.settings.compiler.version) < "4":
                 raise ConanInvalidConfiguration(f"{self.ref} doesn't support clang < 4")
@@ -126,14 +163,14 @@ class ProtobufConan(ConanFile):
     def generate(self):
         tc = CMakeToolchain(self)
         tc.cache_variables["CMAKE_INSTALL_CMAKEDIR"] = self._cmake_install_base_path.replace("\\", "/")
-        tc.cache_variables["protobuf_WITH_ZLIB"] = self.options.with_zlib
+        tc.cache_variables["protobuf_WITH_ZLIB"] = bool(self.options.get_safe("with_zlib"))
         tc.cache_variables["protobuf_BUILD_TESTS"] = False
         tc.cache_variables["protobuf_BUILD_PROTOC_BINARIES"] = self.settings.os != "tvOS"
         if not self.options.debug_suffix:
             tc.cache_variables["protobuf_DEBUG_POSTFIX"] = ""
         tc.cache_variables["protobuf_BUILD_LIBPROTOC"] = self.settings.os != "tvOS"
         tc.cache_variables["protobuf_DISABLE_RTTI"] = not self.options.with_rtti
-        tc.cache_variables["protobuf_BUILD_LIBUPB"] = self.options.get_safe("upb")
+        tc.cache_variables["protobuf_BUILD_LIBUPB"] = self._with_upb
         if self._protobuf_release >= "22.0":
             tc.cache_variables["protobuf_ABSL_PROVIDER"] = "package"
             if not self.settings.compiler.get_safe("cppstd") and self._protobuf_release >= "22.0":
@@ -190,6 +227,29 @@ class ProtobufConan(ConanFile):
             "endif()",
         )
 
+        self._patch_arena_allocation_policy()
+
+    def _patch_arena_allocation_policy(self):
+        block_sizes = {
+            "kDefaultStartBlockSize": self.options.arena_start_block_size,
+            "kDefaultMaxBlockSize": self.options.arena_max_block_size,
+        }
+        if not any(block_sizes.values()):
+            return
+        # AllocationPolicy lives in arena_impl.h up to 3.x, in its own header since 4.x
+        protobuf_src = os.path.join(self.source_folder, "src", "google", "protobuf")
+        policy_header = os.path.join(protobuf_src, "arena_allocation_policy.h")
+        if not os.path.isfile(policy_header):
+            policy_header = os.path.join(protobuf_src, "arena_impl.h")
+        content = load(self, policy_header)
+        for name, value in block_sizes.items():
+            if not value:
+                continue
+            content, count = re.subn(rf"(static constexpr size_t {name} =)[^;]+;", rf"\g<1> {value};", content)
+            if count != 1:
+                raise ConanException(f"Could not find {name} in {policy_header}")
+        save(self, policy_header, content)
+
     def build(self):
         self._patch_sources()
         cmake = CMake(self)
@@ -212,9 +272,13 @@ class ProtobufConan(ConanFile):
         rm(self, "protobuf-targets*.cmake", folder=cmake_config_folder)
         copy(self, "protobuf-conan-protoc-target.cmake", src=self.source_folder, dst=cmake_config_folder)
 
-        if not self.options.lite:
+        if not self._with_lite:
             rm(self, "libprotobuf-lite*", os.path.join(self.package_folder, "lib"))
             rm(self, "libprotobuf-lite*", os.path.join(self.package_folder, "bin"))
+        if self.options.runtime != "full" and not self.options.shared:
+            # protoc is statically linked, so the full runtime and libprotoc are not needed anymore
+            for pattern in ("libprotobuf.*", "libprotobufd.*", "protobuf.lib", "protobufd.lib", "libprotoc*", "protoc.lib", "protocd.lib"):
+                rm(self, pattern, os.path.join(self.package_folder, "lib"))
 
     def package_info(self):
         self.cpp_info.set_property("cmake_find_mode", "both")
@@ -224,10 +288,12 @@ class ProtobufConan(ConanFile):
 
         build_modules = [
             os.path.join(self._cmake_install_base_path, "protobuf-generate.cmake"),
-            os.path.join(self._cmake_install_base_path, "protobuf-module.cmake"),
             os.path.join(self._cmake_install_base_path, "protobuf-options.cmake"),
             os.path.join(self._cmake_install_base_path, "protobuf-conan-protoc-target.cmake"),
         ]
+        if self.options.runtime == "full":
+            # FindProtobuf emulation relies on protobuf::libprotobuf target
+            build_modules.insert(1, os.path.join(self._cmake_install_base_path, "protobuf-module.cmake"))
         self.cpp_info.set_property("cmake_build_modules", build_modules)
 
         lib_prefix = "lib" if (is_msvc(self) or self._is_clang_cl) else ""
@@ -236,7 +302,7 @@ class ProtobufConan(ConanFile):
         if self._protobuf_release >= "22.0":
             absl_deps = [f"abseil::{c}" for c in self.conan_data["absl_deps"][self.version]]
 
-        if self._protobuf_release >= "22.0" and (not self.options.shared or self.options.get_safe("upb")):
+        if self._protobuf_release >= "22.0" and (not self.options.shared or self._with_upb):
             # utf8 libraries
             # it's a private dependency and unconditionally built as a static library, should only
             # be exposed when protobuf itself is static (or if upb is being built)
@@ -246,44 +312,47 @@ class ProtobufConan(ConanFile):
             self.cpp_info.components["utf8_validity"].libs = ["utf8_validity"]
             self.cpp_info.components["utf8_validity"].requires = ["abseil::absl_strings"]
 
-        if self.options.get_safe("upb"):
+        if self._with_upb:
             # upb libraries: note that these are unconditionally static
             self.cpp_info.components["upb"].set_property("cmake_target_name", "protobuf::libupb")
             self.cpp_info.components["upb"].libs = [lib_prefix + "upb" + lib_suffix]
             self.cpp_info.components["upb"].requires = ["utf8_range"]
+            if self.options.runtime == "upb":
+                self.cpp_info.components["upb"].builddirs.append(self._cmake_install_base_path)
 
         # libprotobuf
-        self.cpp_info.components["libprotobuf"].set_property("cmake_target_name", "protobuf::libprotobuf")
-        self.cpp_info.components["libprotobuf"].set_property("pkg_config_name", "protobuf")
-        self.cpp_info.components["libprotobuf"].builddirs.append(self._cmake_install_base_path)
-        self.cpp_info.components["libprotobuf"].libs = [lib_prefix + "protobuf" + lib_suffix]
-        if self.options.with_zlib:
-            self.cpp_info.components["libprotobuf"].requires = ["zlib::zlib"]
-        if self._protobuf_release >= "22.0":     
-            self.cpp_info.components["libprotobuf"].requires.extend(absl_deps)
-            if not self.options.shared:
-                self.cpp_info.components["libprotobuf"].requires.extend(["utf8_validity"])
-
-        if self.settings.os in ["Linux", "FreeBSD"]:
-            self.cpp_info.components["libprotobuf"].system_libs.extend(["m", "pthread"])
-            if self._is_clang_x86 or "arm" in str(self.settings.arch):
-                self.cpp_info.components["libprotobuf"].system_libs.append("atomic")
-        if self.settings.os == "Android":
-            self.cpp_info.components["libprotobuf"].system_libs.append("log")
-        if self.settings.os == "Windows":
-            if self.options.shared:
-                self.cpp_info.components["libprotobuf"].defines = ["PROTOBUF_USE_DLLS"]
-
-        # libprotoc
-        if self.settings.os != "tvOS":
-            self.cpp_info.components["libprotoc"].set_property("cmake_target_name", "protobuf::libprotoc")
-            self.cpp_info.components["libprotoc"].libs = [lib_prefix + "protoc" + lib_suffix]
-            self.cpp_info.components["libprotoc"].requires = ["libprotobuf"]
-            if self._protobuf_release >= "22.0":
-                self.cpp_info.components["libprotoc"].requires.extend(absl_deps)
+        if self.options.runtime == "full":
+            self.cpp_info.components["libprotobuf"].set_property("cmake_target_name", "protobuf::libprotobuf")
+            self.cpp_info.components["libprotobuf"].set_property("pkg_config_name", "protobuf")
+            self.cpp_info.components["libprotobuf"].builddirs.append(self._cmake_install_base_path)
+            self.cpp_info.components["libprotobuf"].libs = [lib_prefix + "protobuf" + lib_suffix]
+            if self.options.get_safe("with_zlib"):
+                self.cpp_info.components["libprotobuf"].requires = ["zlib::zlib"]
+            if self._protobuf_release >= "22.0":     
+                self.cpp_info.components["libprotobuf"].requires.extend(absl_deps)
+                if not self.options.shared:
+                    self.cpp_info.components["libprotobuf"].requires.extend(["utf8_validity"])
+
+            if self.settings.os in ["Linux", "FreeBSD"]:
+                self.cpp_info.components["libprotobuf"].system_libs.extend(["m", "pthread"])
+                if self._is_clang_x86 or "arm" in str(self.settings.arch):
+                    self.cpp_info.components["libprotobuf"].system_libs.append("atomic")
+            if self.settings.os == "Android":
+                self.cpp_info.components["libprotobuf"].system_libs.append("log")
+            if self.settings.os == "Windows":
+                if self.options.shared:
+                    self.cpp_info.components["libprotobuf"].defines = ["PROTOBUF_USE_DLLS"]
+
+            # libprotoc
+            if self.settings.os != "tvOS":
+                self.cpp_info.components["libprotoc"].set_property("cmake_target_name", "protobuf::libprotoc")
+                self.cpp_info.components["libprotoc"].libs = [lib_prefix + "protoc" + lib_suffix]
+                self.cpp_info.components["libprotoc"].requires = ["libprotobuf"]
+                if self._protobuf_release >= "22.0":
+                    self.cpp_info.components["libprotoc"].requires.extend(absl_deps)
 
         # libprotobuf-lite
-        if self.options.lite:
+        if self._with_lite:
             self.cpp_info.components["libprotobuf-lite"].set_property("cmake_target_name", "protobuf::libprotobuf-lite")
             self.cpp_info.components["libprotobuf-lite"].set_property("pkg_config_name", "protobuf-lite")
             self.cpp_info.components["libprotobuf-lite"].builddirs.append(self._cmake_install_base_path)
@@ -299,14 +368,17 @@ class ProtobufConan(ConanFile):
                 self.cpp_info.components["libprotobuf-lite"].system_libs.append("log")
             if self._protobuf_release >= "22.0":
                 self.cpp_info.components["libprotobuf-lite"].requires.extend(absl_deps)
+                if not self.options.shared:
+                    self.cpp_info.components["libprotobuf-lite"].requires.append("utf8_validity")
 
         # TODO: to remove in conan v2 once cmake_find_package* & pkg_config generators removed
         self.cpp_info.filenames["cmake_find_package"] = "Protobuf"
         self.cpp_info.filenames["cmake_find_package_multi"] = "protobuf"
         self.cpp_info.names["pkg_config"] ="protobuf_full_package"
-        for generator in ["cmake_find_package", "cmake_find_package_multi"]:
-            self.cpp_info.components["libprotobuf"].build_modules[generator] = build_modules
-        if self.options.lite:
+        if self.options.runtime == "full":
+            for generator in ["cmake_find_package", "cmake_find_package_multi"]:
+                self.cpp_info.components["libprotobuf"].build_modules[generator] = build_modules
+        if self._with_lite:
             for generator in ["cmake_find_package", "cmake_find_package_multi"]:
                 self.cpp_info.components["libprotobuf-lite"].build_modules[generator] = build_modules
         self.env_info.PATH.append(os.path.join(self.package_folder, "bin"))
@@ -3,7 +3,7 @@ import glob
 import shutil
 
 from conan import ConanFile
-from conan.errors import ConanInvalidConfiguration
+from conan.errors import ConanException, ConanInvalidConfiguration
 from conan.tools.build import check_min_cppstd
 from conan.tools.cmake import CMake, CMakeDeps, CMakeToolchain, cmake_layout
 from conan.tools.files import apply_conandata_patches, collect_libs, copy, export_conandata_patches, get, rm, rmdir
@@ -33,8 +33,12 @@ class RocksDBConan(ConanFile):
         "with_zstd": [True, False],
         "with_tbb": [True, False],
         "with_jemalloc": [True, False],
+        "with_numa": [True, False],
+        "with_liburing": [True, False],
+        "with_folly": [True, False],
         "enable_sse": [False, "sse42", "avx2"],
         "use_rtti": [True, False],
+        "build_tools": [True, False],
     }
     default_options = {
         "shared": False,
@@ -47,8 +51,12 @@ class RocksDBConan(ConanFile):
         "with_gflags": False,
         "with_tbb": False,
         "with_jemalloc": False,
+        "with_numa": False,
+        "with_liburing": False,
+        "with_folly": False,
         "enable_sse": False,
         "use_rtti": False,
+        "build_tools": False,
     }
 
     @property
@@ -73,6 +81,12 @@ class RocksDBConan(ConanFile):
             del self.options.fPIC
         if self.settings.arch != "x86_64":
             del self.options.with_tbb
+        if self.settings.os != "Linux":
+            del self.options.with_numa
+            del self.options.with_liburing
+        if Version(self.version) < "8.8.1":
+            # Older releases only know about the folly sources bundled in third-party/
+            del self.options.with_folly
         if self.settings.build_type == "Debug":
             self.options.use_rtti = True  # Rtti are used in asserts for debug mode...
 
@@ -98,6 +112,12 @@ class RocksDBConan(ConanFile):
             self.requires("onetbb/2021.10.0")
         if self.options.with_jemalloc:
             self.requires("jemalloc/5.3.0")
+        if self.options.get_safe("with_numa"):
+            self.requires("libnuma/2.0.16")
+        if self.options.get_safe("with_liburing"):
+            self.requires("liburing/2.6")
+        if self.options.get_safe("with_folly"):
+            self.requires("folly/2024.08.12.00")
 
     def validate(self):
         if self.settings.compiler.get_safe("cppstd"):
@@ -114,6 +134,12 @@ class RocksDBConan(ConanFile):
 
         check_min_vs(self, "191")
 
+        if self.options.get_safe("with_folly") and self.options.shared:
+            raise ConanInvalidConfiguration(f"{self.ref} can not be built as a shared library with folly (upstream limitation)")
+
+        if self.options.build_tools and not self.options.with_gflags:
+            raise ConanInvalidConfiguration(f"{self.ref} requires -o {self.ref.name}/*:with_gflags=True to build db_bench")
+
         if self.version == "6.20.3" and \
            self.settings.os == "Linux" and \
            self.settings.compiler == "gcc" and \
@@ -128,9 +154,14 @@ class RocksDBConan(ConanFile):
         tc.variables["FAIL_ON_WARNINGS"] = False
         tc.variables["WITH_TESTS"] = False
         tc.variables["WITH_TOOLS"] = False
-        tc.variables["WITH_CORE_TOOLS"] = False
-        tc.variables["WITH_BENCHMARK_TOOLS"] = False
-        tc.variables["WITH_FOLLY_DISTRIBUTED_MUTEX"] = False
+        tc.variables["WITH_CORE_TOOLS"] = self.options.build_tools
+        tc.variables["WITH_BENCHMARK_TOOLS"] = self.options.build_tools
+        tc.variables["WITH_FOLLY_DISTRIBUTED_MUTEX"] = self.options.get_safe("with_folly", False)
+        if self.options.get_safe("with_folly"):
+            tc.variables["USE_FOLLY"] = True
+            # Skip the fallback lookup of folly through getdeps.py in third-party/folly,
+            # Folly::folly is the target of the libfolly component generated by CMakeDeps
+            tc.cache_variables["FOLLY_LIBRARIES"] = "Folly::folly"
         if is_msvc(self):
             tc.variables["WITH_MD_LIBRARY"] = not is_msvc_static_runtime(self)
         tc.variables["ROCKSDB_INSTALL_ON_WINDOWS"] = self.settings.os == "Windows"
@@ -155,8 +186,8 @@ class RocksDBConan(ConanFile):
         elif self.options.enable_sse == "avx2":
             tc.variables["PORTABLE"] = False
             tc.variables["FORCE_SSE42"] = False
-        # not available yet in CCI
-        tc.variables["WITH_NUMA"] = False
+        tc.variables["WITH_NUMA"] = self.options.get_safe("with_numa", False)
+        tc.variables["WITH_LIBURING"] = self.options.get_safe("with_liburing", False)
         tc.generate()
 
         deps = CMakeDeps(self)
@@ -165,6 +196,12 @@ class RocksDBConan(ConanFile):
             deps.set_property("jemalloc", "cmake_target_name", "JeMalloc::JeMalloc")
         if self.options.with_zstd:
             deps.set_property("zstd", "cmake_target_name", "zstd::zstd")
+        if self.options.get_safe("with_numa"):
+            deps.set_property("libnuma", "cmake_file_name", "NUMA")
+            deps.set_property("libnuma", "cmake_target_name", "NUMA::NUMA")
+        if self.options.get_safe("with_liburing"):
+            deps.set_property("liburing", "cmake_file_name", "uring")
+            deps.set_property("liburing", "cmake_target_name", "uring::uring")
         deps.generate()
 
     def build(self):
@@ -192,6 +229,15 @@ class RocksDBConan(ConanFile):
         copy(self, "LICENSE*", src=self.source_folder, dst=os.path.join(self.package_folder, "licenses"))
         cmake = CMake(self)
         cmake.install()
+        if self.options.build_tools:
+            # db_bench, ldb and sst_dump have no install rules upstream; ldb and sst_dump are built
+            # in tools/, and multi-config generators add a per-configuration subfolder
+            bin_folder = os.path.join(self.package_folder, "bin")
+            for tool in ("db_bench", "ldb", "sst_dump"):
+                copy(self, f"*{tool}", src=self.build_folder, dst=bin_folder, keep_path=False)
+                copy(self, f"*{tool}.exe", src=self.build_folder, dst=bin_folder, keep_path=False)
+                if not any(os.path.isfile(os.path.join(bin_folder, f"{tool}{ext}")) for ext in ("", ".exe")):
+                    raise ConanException(f"{tool} was not found in the build folder")
         if self.options.shared:
             self._remove_static_libraries()
             self._remove_cpp_headers() # Force stable ABI for shared libraries
@@ -233,3 +279,13 @@ class RocksDBConan(ConanFile):
             self.cpp_info.components["librocksdb"].requires.append("onetbb::onetbb")
         if self.options.with_jemalloc:
             self.cpp_info.components["librocksdb"].requires.append("jemalloc::jemalloc")
+        if self.options.get_safe("with_numa"):
+            self.cpp_info.components["librocksdb"].requires.append("libnuma::libnuma")
+        if self.options.get_safe("with_liburing"):
+            self.cpp_info.components["librocksdb"].requires.append("liburing::liburing")
+        if self.options.get_safe("with_folly"):
+            self.cpp_info.components["librocksdb"].requires.append("folly::libfolly")
+
+        if self.options.build_tools:
+            # TODO: to remove in conan v2
+            self.env_info.PATH.append(os.path.join(self.package_folder, "bin"))
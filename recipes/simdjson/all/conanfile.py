@@ -24,12 +24,66 @@ class SimdjsonConan(ConanFile):
         "shared": [True, False],
         "fPIC": [True, False],
         "threads": [True, False],
+        "implementations": [None, "ANY"],
+        "builtin_implementation": [None, "icelake", "haswell", "westmere", "arm64", "fallback"],
     }
     default_options = {
         "shared": False,
         "fPIC": True,
         "threads": True,
+        "implementations": None,
+        "builtin_implementation": None,
     }
+    options_description = {
+        "implementations": "Comma-separated list of kernels to compile (icelake, haswell, westmere, arm64, ppc64, fallback), "
+                           "all kernels supported by the target are compiled if unset",
+        "builtin_implementation": "Compile a single kernel and target its instruction set, removing runtime dispatch",
+    }
+
+    @property
+    def _all_implementations(self):
+        return ["icelake", "haswell", "westmere", "arm64", "ppc64", "fallback"]
+
+    @property
+    def _implementation_archs(self):
+        # target architectures each kernel can be built for, None means any
+        return {
+            "icelake": ["x86_64"],
+            "haswell": ["x86_64"],
+            "westmere": ["x86_64"],
+            "arm64": ["armv8"],
+            "ppc64": ["ppc64le", "ppc64"],
+            "fallback": None,
+        }
+
+    @property
+    def _enabled_implementations(self):
+        if self.options.builtin_implementation:
+            return [str(self.options.builtin_implementation)]
+        if self.options.implementations:
+            return [impl.strip() for impl in str(self.options.implementations).split(",") if impl.strip()]
+        return None
+
+    @property
+    def _implementation_defines(self):
+        enabled = self._enabled_implementations
+        if enabled is None:
+            return {}
+        return {f"SIMDJSON_IMPLEMENTATION_{impl.upper()}": int(impl in enabled) for impl in self._all_implementations}
+
+    @property
+    def _builtin_isa_flags(self):
+        builtin = self.options.builtin_implementation
+        if is_msvc(self):
+            return {
+                "icelake": ["/arch:AVX512"],
+                "haswell": ["/arch:AVX2"],
+            }.get(str(builtin), [])
+        return {
+            "icelake": ["-march=icelake-server"],
+            "haswell": ["-march=haswell"],
+            "westmere": ["-march=westmere"],
+        }.get(str(builtin), [])
 
     @property
     def _min_cppstd(self):
@@ -56,6 +110,12 @@ class SimdjsonConan(ConanFile):
     def layout(self):
         cmake_layout(self, src_folder="src")
 
+    def package_id(self):
+        # Same binary regardless of the order or spacing of the list
+        if self.info.options.implementations:
+            implementations = [impl.strip() for impl in str(self.info.options.implementations).split(",") if impl.strip()]
+            self.info.options.implementations = ",".join(sorted(set(implementations)))
+
     def validate(self):
         if self.settings.compiler.get_safe("cppstd"):
             check_min_cppstd(self, self._min_cppstd)
@@ -72,6 +132,24 @@ class SimdjsonConan(ConanFile):
                 f"{self.ref} requires C++{self._min_cppstd}, which your compiler does not fully support."
             )
 
+        if self.options.implementations and self.options.builtin_implementation:
+            raise ConanInvalidConfiguration("options implementations and builtin_implementation are mutually exclusive")
+        enabled = self._enabled_implementations
+        if enabled is not None:
+            if not enabled:
+                raise ConanInvalidConfiguration("option implementations must list at least one kernel")
+            unknown = set(enabled) - set(self._all_implementations)
+            if unknown:
+                raise ConanInvalidConfiguration(f"Unknown simdjson implementations: {', '.join(sorted(unknown))}")
+            for impl in enabled:
+                archs = self._implementation_archs[impl]
+                if archs is not None and str(self.settings.arch) not in archs:
+                    raise ConanInvalidConfiguration(
+                        f"simdjson implementation {impl} is not available on {self.settings.arch}, it requires {' or '.join(archs)}")
+        builtin = self.options.builtin_implementation
+        if builtin == "westmere" and is_msvc(self):
+            raise ConanInvalidConfiguration("builtin_implementation=westmere cannot be targeted with MSVC")
+
     def source(self):
         get(self, **self.conan_data["sources"][self.version], strip_root=True)
 
@@ -79,6 +157,9 @@ class SimdjsonConan(ConanFile):
         tc = CMakeToolchain(self)
         tc.variables["SIMDJSON_ENABLE_THREADS"] = self.options.threads
         tc.variables["SIMDJSON_DEVELOPER_MODE"] = False
+        for name, value in self._implementation_defines.items():
+            tc.preprocessor_definitions[name] = value
+        tc.extra_cxxflags.extend(self._builtin_isa_flags)
         tc.generate()
 
     def _patch_sources(self):
@@ -112,6 +193,9 @@ class SimdjsonConan(ConanFile):
             self.cpp_info.defines = ["SIMDJSON_THREADS_ENABLED=1"]
             if self.settings.os in ["Linux", "FreeBSD"]:
                 self.cpp_info.system_libs.append("pthread")
+        # consumers must see the same set of kernels as the library
+        self.cpp_info.defines.extend(f"{name}={value}" for name, value in self._implementation_defines.items())
+        self.cpp_info.cxxflags = self._builtin_isa_flags
         if self.options.shared:
             self.cpp_info.defines.append("SIMDJSON_USING_LIBRARY=1")
             if is_msvc(self):
@@ -1,7 +1,35 @@
 #include "simdjson.h"
+#include <chrono>
 #include <iostream>
 #include <string>
 
+// Build a twitter.json-like document: an array of statuses with nested users,
+// entities, unicode text and numbers, roughly 600 KB like the upstream sample.
+static std::string make_statuses(size_t count) {
+  std::string json = "{\"statuses\":[";
+  for (size_t i = 0; i < count; ++i) {
+    if (i > 0) {
+      json += ",";
+    }
+    const std::string id = std::to_string(505874924095815681ULL + i);
+    json += "{\"metadata\":{\"result_type\":\"recent\",\"iso_language_code\":\"ja\"},"
+            "\"created_at\":\"Sun Aug 31 00:29:15 +0000 2014\",\"id\":" + id + ",\"id_str\":\"" + id + "\","
+            "\"text\":\"@aym0566x \\n\\n\\u540d\\u524d:\\u524d\\u7530\\u3042\\u3086\\u307f simdjson benchmark\","
+            "\"source\":\"<a href=\\\"http://twitter.com/download/iphone\\\" rel=\\\"nofollow\\\">Twitter for iPhone</a>\","
+            "\"truncated\":false,\"in_reply_to_status_id\":null,\"in_reply_to_user_id\":866260188,"
+            "\"user\":{\"id\":1186275104,\"name\":\"AYUMI\",\"screen_name\":\"ayuu0123\",\"location\":\"\","
+            "\"description\":\"\\u5143\\u91ce\\u7403\\u90e8\\u30de\\u30cd\\u30fc\\u30b8\\u30e3\\u30fc\","
+            "\"followers_count\":262,\"friends_count\":252,\"listed_count\":0,\"favourites_count\":235,"
+            "\"utc_offset\":null,\"verified\":false,\"statuses_count\":1769,\"lang\":\"en\"},"
+            "\"geo\":null,\"coordinates\":[139.6917,35.6895],\"retweet_count\":" + std::to_string(i % 100) + ","
+            "\"favorite_count\":0,\"entities\":{\"hashtags\":[],\"symbols\":[],\"urls\":[],"
+            "\"user_mentions\":[{\"screen_name\":\"aym0566x\",\"name\":\"\\u524d\\u7530\\u3042\\u3086\\u307f\","
+            "\"id\":866260188,\"indices\":[0,9]}]},\"favorited\":false,\"retweeted\":false,\"lang\":\"ja\"}";
+  }
+  json += "]}";
+  return json;
+}
+
 int main() {
   std::string mystring = "{ \"hello\": \"simdjson\" }";
   simdjson::dom::parser parser;
@@ -15,5 +43,26 @@ int main() {
     std::cerr << string_value << std::endl;
     return EXIT_FAILURE;
   }
+
+  // Parse throughput
+  const simdjson::padded_string document(make_statuses(600));
+  const int iterations = 200;
+  size_t statuses = 0;
+  const auto start = std::chrono::steady_clock::now();
+  for (int i = 0; i < iterations; ++i) {
+    simdjson::dom::array array;
+    error = parser.parse(document)["statuses"].get(array);
+    if (error) {
+      std::cerr << error << std::endl;
+      return EXIT_FAILURE;
+    }
+    statuses += array.size();
+  }
+  const std::chrono::duration<double> elapsed = std::chrono::steady_clock::now() - start;
+  const double gigabytes = double(document.size()) * iterations / 1e9;
+
+  std::cout << "simdjson implementation: " << simdjson::get_active_implementation()->name() << std::endl;
+  std::cout << "parsed " << statuses << " statuses, " << document.size() << " bytes x " << iterations
+            << ": " << gigabytes / elapsed.count() << " GB/s" << std::endl;
   return EXIT_SUCCESS;
 }
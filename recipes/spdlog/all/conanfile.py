@@ -1,11 +1,12 @@
 from conan import ConanFile
-from conan.errors import ConanInvalidConfiguration
+from conan.errors import ConanException, ConanInvalidConfiguration
 from conan.tools.build import check_min_cppstd
 from conan.tools.cmake import CMake, CMakeToolchain, CMakeDeps, cmake_layout
-from conan.tools.files import get, copy, rmdir, replace_in_file, apply_conandata_patches, export_conandata_patches
+from conan.tools.files import get, copy, load, rmdir, replace_in_file, save, apply_conandata_patches, export_conandata_patches
 from conan.tools.microsoft import check_min_vs, is_msvc, is_msvc_static_runtime
 from conan.tools.scm import Version
 import os
+import re
 
 required_conan_version = ">=1.53.0"
 
@@ -27,6 +28,13 @@ class SpdlogConan(ConanFile):
         "wchar_filenames": [True, False],
         "no_exceptions": [True, False],
         "use_std_fmt": [True, False],
+        "active_level": [None, "trace", "debug", "info", "warn", "error", "critical", "off"],
+        "no_source_loc": [True, False],
+        "no_thread_id": [True, False],
+        "no_atomic_levels": [True, False],
+        "no_tls": [True, False],
+        "clock_coarse": [True, False],
+        "async_queue_size": [None, "ANY"],
     }
     default_options = {
         "shared": False,
@@ -36,7 +44,42 @@ class SpdlogConan(ConanFile):
         "wchar_filenames": False,
         "no_exceptions": False,
         "use_std_fmt": False,
+        "active_level": None,
+        "no_source_loc": False,
+        "no_thread_id": False,
+        "no_atomic_levels": False,
+        "no_tls": False,
+        "clock_coarse": False,
+        "async_queue_size": None,
     }
+    options_description = {
+        "active_level": "Compile-time log level (SPDLOG_ACTIVE_LEVEL), SPDLOG_* macros below it compile to nothing",
+        "no_source_loc": "Do not capture source locations in SPDLOG_* macros (SPDLOG_NO_SOURCE_LOC)",
+        "no_thread_id": "Do not query the thread id for each message (SPDLOG_NO_THREAD_ID)",
+        "no_atomic_levels": "Use plain instead of atomic log levels (SPDLOG_NO_ATOMIC_LEVELS)",
+        "no_tls": "Do not use thread local storage (SPDLOG_NO_TLS)",
+        "clock_coarse": "Use CLOCK_REALTIME_COARSE for timestamps (SPDLOG_CLOCK_COARSE)",
+        "async_queue_size": "Default queue size of the async thread pool (SPDLOG_ASYNC_QUEUE_SIZE), upstream default is 8192",
+    }
+
+    @property
+    def _tuning_defines(self):
+        defines = []
+        if self.options.active_level:
+            defines.append(f"SPDLOG_ACTIVE_LEVEL=SPDLOG_LEVEL_{str(self.options.active_level).upper()}")
+        if self.options.no_source_loc:
+            defines.append("SPDLOG_NO_SOURCE_LOC")
+        if self.options.no_thread_id:
+            defines.append("SPDLOG_NO_THREAD_ID")
+        if self.options.no_atomic_levels:
+            defines.append("SPDLOG_NO_ATOMIC_LEVELS")
+        if self.options.no_tls or self.settings.os in ("iOS", "tvOS", "watchOS"):
+            defines.append("SPDLOG_NO_TLS")
+        if self.options.get_safe("clock_coarse"):
+            defines.append("SPDLOG_CLOCK_COARSE")
+        if self.options.async_queue_size:
+            defines.append(f"SPDLOG_ASYNC_QUEUE_SIZE={self.options.async_queue_size}")
+        return defines
 
     def export_sources(self):
         export_conandata_patches(self)
@@ -46,6 +89,9 @@ class SpdlogConan(ConanFile):
             del self.options.fPIC
         if Version(self.version) < "1.10.0":
             del self.options.use_std_fmt
+        if self.settings.os != "Linux":
+            # CLOCK_REALTIME_COARSE is Linux specific
+            del self.options.clock_coarse
 
     def configure(self):
         if self.options.get_safe("shared") or self.options.header_only:
@@ -98,6 +144,8 @@ class SpdlogConan(ConanFile):
             raise ConanInvalidConfiguration("wchar is only supported under windows")
         if self.options.get_safe("shared") and is_msvc_static_runtime(self):
             raise ConanInvalidConfiguration("Visual Studio build for shared library with MT runtime is not supported")
+        if self.options.async_queue_size and not str(self.options.async_queue_size).isdigit():
+            raise ConanInvalidConfiguration(f"option async_queue_size must be a positive integer, got '{self.options.async_queue_size}'")
     
         if self.options.get_safe("use_std_fmt"):
             check_min_vs(self, self._std_fmt_compilers_minimum_version["msvc"])
@@ -132,8 +180,13 @@ class SpdlogConan(ConanFile):
             tc.variables["SPDLOG_INSTALL"] = True
             tc.variables["SPDLOG_NO_EXCEPTIONS"] = self.options.no_exceptions
             tc.variables["SPDLOG_USE_STD_FORMAT"] = self.options.get_safe("use_std_fmt")
-            if self.settings.os in ("iOS", "tvOS", "watchOS"):
-                tc.variables["SPDLOG_NO_TLS"] = True
+            tc.variables["SPDLOG_NO_TLS"] = "SPDLOG_NO_TLS" in self._tuning_defines
+            tc.variables["SPDLOG_NO_THREAD_ID"] = self.options.no_thread_id
+            tc.variables["SPDLOG_NO_ATOMIC_LEVELS"] = self.options.no_atomic_levels
+            tc.variables["SPDLOG_CLOCK_COARSE"] = bool(self.options.get_safe("clock_coarse"))
+            for define in self._tuning_defines:
+                name, _, value = define.partition("=")
+                tc.preprocessor_definitions[name] = value or 1
             tc.cache_variables["CMAKE_POLICY_DEFAULT_CMP0091"] = "NEW"
             tc.generate()
         cmake_deps = CMakeDeps(self)
@@ -148,8 +201,22 @@ class SpdlogConan(ConanFile):
             replace_in_file(self, os.path.join(self.source_folder, "CMakeLists.txt"),
                             "CMAKE_CXX_STANDARD 11", "CMAKE_CXX_STANDARD 20")
 
+    def _patch_async_queue_size(self):
+        # Let SPDLOG_ASYNC_QUEUE_SIZE override the default size, header-only packages are shared by all option values
+        async_h = os.path.join(self.source_folder, "include", "spdlog", "async.h")
+        content, count = re.subn(r"static const size_t default_async_q_size = (\d+);",
+                                 "#ifndef SPDLOG_ASYNC_QUEUE_SIZE\n"
+                                 "#define SPDLOG_ASYNC_QUEUE_SIZE \\1\n"
+                                 "#endif\n"
+                                 "static const size_t default_async_q_size = SPDLOG_ASYNC_QUEUE_SIZE;",
+                                 load(self, async_h))
+        if count != 1:
+            raise ConanException(f"Could not find default_async_q_size in {async_h}")
+        save(self, async_h, content)
+
     def build(self):
         apply_conandata_patches(self)
+        self._patch_async_queue_size()
         self._disable_werror()
         self._use_cpp20_for_std_format()
         if not self.options.header_only:
@@ -200,8 +267,7 @@ class SpdlogConan(ConanFile):
             self.cpp_info.components["libspdlog"].defines.append("SPDLOG_NO_EXCEPTIONS")
         if self.settings.os in ["Linux", "FreeBSD"]:
             self.cpp_info.components["libspdlog"].system_libs = ["pthread"]
-        if self.options.header_only and self.settings.os in ("iOS", "tvOS", "watchOS"):
-            self.cpp_info.components["libspdlog"].defines.append("SPDLOG_NO_TLS")
+        self.cpp_info.components["libspdlog"].defines.extend(self._tuning_defines)
 
         self.cpp_info.names["cmake_find_package"] = "spdlog"
         self.cpp_info.names["cmake_find_package_multi"] = "spdlog"
@@ -48,6 +48,14 @@ class Sqlite3Conan(ConanFile):
         "build_executable": [True, False],
         "enable_default_vfs": [True, False],
         "enable_dbpage_vtab": [True, False],
+        "default_cache_size": [None, "ANY"],
+        "default_page_size": [None, "ANY"],
+        "default_wal_synchronous": [None, 0, 1, 2, 3],
+        "default_mmap_size": [None, "ANY"],
+        "max_mmap_size": [None, "ANY"],
+        "enable_memsys5": [True, False],
+        "default_memstatus": [True, False],
+        "like_doesnt_match_blobs": [True, False],
     }
     default_options = {
         "shared": False,
@@ -78,6 +86,14 @@ class Sqlite3Conan(ConanFile):
         "build_executable": True,
         "enable_default_vfs": True,
         "enable_dbpage_vtab": False,
+        "default_cache_size": None,         # Uses default value from source
+        "default_page_size": None,          # Uses default value from source
+        "default_wal_synchronous": None,    # Uses default value from source
+        "default_mmap_size": None,          # Uses default value from source
+        "max_mmap_size": None,              # Uses default value from source
+        "enable_memsys5": False,
+        "default_memstatus": True,
+        "like_doesnt_match_blobs": False,
     }
 
     exports_sources = "CMakeLists.txt"
@@ -108,6 +124,21 @@ class Sqlite3Conan(ConanFile):
                 raise ConanInvalidConfiguration("build_executable=True cannot be combined with enable_default_vfs=False")
             if self.options.omit_load_extension:
                 raise ConanInvalidConfiguration("build_executable=True requires omit_load_extension=True")
+        if self.options.default_page_size:
+            page_size = str(self.options.default_page_size)
+            if not page_size.isdigit() or int(page_size) not in [2 ** i for i in range(9, 17)]:
+                raise ConanInvalidConfiguration("default_page_size must be a power of two between 512 and 65536")
+        if self.options.default_cache_size != None:
+            # positive values are a number of pages, negative ones a size in KiB
+            if not str(self.options.default_cache_size).lstrip("-").isdigit():
+                raise ConanInvalidConfiguration("default_cache_size must be an integer")
+        for option in ("default_mmap_size", "max_mmap_size"):
+            value = self.options.get_safe(option)
+            if value != None and not str(value).isdigit():
+                raise ConanInvalidConfiguration(f"{option} must be a non-negative number of bytes")
+        if self.options.default_mmap_size != None and self.options.max_mmap_size != None:
+            if int(str(self.options.default_mmap_size)) > int(str(self.options.max_mmap_size)):
+                raise ConanInvalidConfiguration("default_mmap_size cannot be greater than max_mmap_size")
 
     def source(self):
         get(self, **self.conan_data["sources"][self.version], strip_root=True)
@@ -152,6 +183,19 @@ class Sqlite3Conan(ConanFile):
             tc.variables["MAX_BLOB_SIZE"] = self.options.max_blob_size
         tc.variables["DISABLE_DEFAULT_VFS"] = not self.options.enable_default_vfs
         tc.variables["ENABLE_DBPAGE_VTAB"] = self.options.enable_dbpage_vtab
+        if self.options.default_cache_size:
+            tc.variables["DEFAULT_CACHE_SIZE"] = self.options.default_cache_size
+        if self.options.default_page_size:
+            tc.variables["DEFAULT_PAGE_SIZE"] = self.options.default_page_size
+        if self.options.default_wal_synchronous != None:
+            tc.variables["DEFAULT_WAL_SYNCHRONOUS"] = self.options.default_wal_synchronous
+        if self.options.default_mmap_size != None:
+            tc.variables["DEFAULT_MMAP_SIZE"] = self.options.default_mmap_size
+        if self.options.max_mmap_size != None:
+            tc.variables["MAX_MMAP_SIZE"] = self.options.max_mmap_size
+        tc.variables["ENABLE_MEMSYS5"] = self.options.enable_memsys5
+        tc.variables["DISABLE_MEMSTATUS"] = not self.options.default_memstatus
+        tc.variables["LIKE_DOESNT_MATCH_BLOBS"] = self.options.like_doesnt_match_blobs
         tc.generate()
 
     def build(self):
@@ -1,5 +1,6 @@
 #include <stdio.h>
 #include <stdlib.h>
+#include <time.h>
 #include <sqlite3.h>
 
 #ifdef USE_EMPTY_VFS
@@ -8,6 +9,69 @@
 #define DB_NAME "bincrafters.db"
 #endif
 
+#define BENCHMARK_ROWS 1000000
+
+static double elapsed_seconds(clock_t start) {
+    return (double)(clock() - start) / CLOCKS_PER_SEC;
+}
+
+/* Insert and query BENCHMARK_ROWS rows, to compare the performance options of the recipe */
+static int benchmark(sqlite3* db_instance) {
+    sqlite3_stmt* stmt = NULL;
+    sqlite3_int64 sum = 0;
+    clock_t start;
+    int i;
+
+    if (sqlite3_exec(db_instance, "DROP TABLE IF EXISTS benchmark;"
+                                  "CREATE TABLE benchmark(ID INTEGER PRIMARY KEY, VALUE INTEGER, NAME TEXT);",
+                     NULL, 0, NULL) != SQLITE_OK) {
+        return SQLITE_ERROR;
+    }
+
+    start = clock();
+    sqlite3_exec(db_instance, "BEGIN TRANSACTION;", NULL, 0, NULL);
+    sqlite3_prepare_v2(db_instance, "INSERT INTO benchmark(ID, VALUE, NAME) VALUES(?, ?, 'conan');", -1, &stmt, NULL);
+    for (i = 0; i < BENCHMARK_ROWS; ++i) {
+        sqlite3_bind_int(stmt, 1, i);
+        sqlite3_bind_int(stmt, 2, i % 1000);
+        if (sqlite3_step(stmt) != SQLITE_DONE) {
+            sqlite3_finalize(stmt);
+            return SQLITE_ERROR;
+        }
+        sqlite3_reset(stmt);
+    }
+    sqlite3_finalize(stmt);
+    if (sqlite3_exec(db_instance, "COMMIT;", NULL, 0, NULL) != SQLITE_OK) {
+        return SQLITE_ERROR;
+    }
+    printf("Inserted %d rows in %.3f s\n", BENCHMARK_ROWS, elapsed_seconds(start));
+
+    start = clock();
+    sqlite3_prepare_v2(db_instance, "SELECT VALUE FROM benchmark WHERE ID = ?;", -1, &stmt, NULL);
+    for (i = 0; i < BENCHMARK_ROWS; ++i) {
+        sqlite3_bind_int(stmt, 1, i);
+        if (sqlite3_step(stmt) != SQLITE_ROW) {
+            sqlite3_finalize(stmt);
+            return SQLITE_ERROR;
+        }
+        sum += sqlite3_column_int(stmt, 0);
+        sqlite3_reset(stmt);
+    }
+    sqlite3_finalize(stmt);
+    printf("Queried %d rows by primary key in %.3f s (checksum %lld)\n", BENCHMARK_ROWS, elapsed_seconds(start), (long long)sum);
+
+    start = clock();
+    sqlite3_prepare_v2(db_instance, "SELECT COUNT(*) FROM benchmark WHERE VALUE < 500;", -1, &stmt, NULL);
+    if (sqlite3_step(stmt) != SQLITE_ROW) {
+        sqlite3_finalize(stmt);
+        return SQLITE_ERROR;
+    }
+    printf("Scanned %d rows in %.3f s (%d matches)\n", BENCHMARK_ROWS, elapsed_seconds(start), sqlite3_column_int(stmt, 0));
+    sqlite3_finalize(stmt);
+
+    return sqlite3_exec(db_instance, "DROP TABLE benchmark;", NULL, 0, NULL);
+}
+
 int main() {
     sqlite3* db_instance = NULL;
     char* errmsg = NULL;
@@ -33,6 +97,14 @@ int main() {
     }
     printf("Done!\n");
 
+    printf("Running benchmark...\n");
+    if (benchmark(db_instance) != SQLITE_OK) {
+        fprintf(stderr, "Benchmark error: %s\n", sqlite3_errmsg(db_instance));
+        sqlite3_close(db_instance);
+        return EXIT_FAILURE;
+    }
+    printf("Done!\n");
+
     printf("Closing connection ...\n");
     sqlite3_close(db_instance);
     if(result != SQLITE_OK) {
@@ -1,12 +1,14 @@
 from conan import ConanFile
+from conan.errors import ConanInvalidConfiguration
 from conan.tools.apple import fix_apple_shared_install_name
 from conan.tools.env import VirtualBuildEnv
-from conan.tools.files import apply_conandata_patches, copy, export_conandata_patches, get, rename, replace_in_file, rm, rmdir, save
+from conan.tools.files import apply_conandata_patches, copy, export_conandata_patches, get, load, rename, replace_in_file, rm, rmdir, save
 from conan.tools.gnu import Autotools, AutotoolsToolchain
 from conan.tools.layout import basic_layout
 from conan.tools.microsoft import is_msvc, is_msvc_static_runtime, MSBuild, MSBuildToolchain
 from conan.tools.scm import Version
 import os
+import re
 import textwrap
 
 required_conan_version = ">=1.54.0"
@@ -28,11 +30,31 @@ class XZUtilsConan(ConanFile):
     options = {
         "shared": [True, False],
         "fPIC": [True, False],
+        "threads": [True, False],
+        "assembler": [True, False],
+        "match_finders": ["ANY"],
+        "small": [True, False],
     }
     default_options = {
         "shared": False,
         "fPIC": True,
+        "threads": True,
+        "assembler": True,
+        "match_finders": "hc3,hc4,bt2,bt3,bt4",
+        "small": False,
     }
+    options_description = {
+        "threads": "Multithreading support, required by lzma_stream_encoder_mt() and lzma_stream_decoder_mt()",
+        "assembler": "Use the assembler CRC32/CRC64 implementations (x86 only)",
+        "match_finders": "Comma separated list of the match finders to build, among hc3, hc4, bt2, bt3 and bt4",
+        "small": "Optimize for size instead of speed",
+    }
+
+    _all_match_finders = ["hc3", "hc4", "bt2", "bt3", "bt4"]
+
+    @property
+    def _match_finders(self):
+        return [mf.strip() for mf in str(self.options.match_finders).split(",") if mf.strip()]
 
     @property
     def _settings_build(self):
@@ -64,6 +86,9 @@ class XZUtilsConan(ConanFile):
     def config_options(self):
         if self.settings.os == "Windows":
             del self.options.fPIC
+        # assembler code is only available for 32-bit x86, and not used by the MSBuild solution
+        if self.settings.arch != "x86" or self._use_msbuild:
+            del self.options.assembler
 
     def configure(self):
         if self.options.shared:
@@ -74,6 +99,18 @@ class XZUtilsConan(ConanFile):
     def layout(self):
         basic_layout(self, src_folder="src")
 
+    def package_id(self):
+        # Same binary regardless of the order or spacing of the list
+        match_finders = [mf.strip() for mf in str(self.info.options.match_finders).split(",") if mf.strip()]
+        self.info.options.match_finders = ",".join(sorted(set(match_finders)))
+
+    def validate(self):
+        match_finders = self._match_finders
+        if not match_finders or any(mf not in self._all_match_finders for mf in match_finders):
+            raise ConanInvalidConfiguration(
+                f"match_finders must be a comma separated list of {', '.join(self._all_match_finders)}"
+            )
+
     def build_requirements(self):
         if self._settings_build.os == "Windows" and not self._use_msbuild:
             self.win_bash = True
@@ -95,6 +132,12 @@ class XZUtilsConan(ConanFile):
             tc.configure_args.append("--disable-doc")
             if self.settings.build_type == "Debug":
                 tc.configure_args.append("--enable-debug")
+            tc.configure_args.append(f"--enable-threads={'yes' if self.options.threads else 'no'}")
+            if self.options.get_safe("assembler") is not None:
+                tc.configure_args.append(f"--enable-assembler={'yes' if self.options.assembler else 'no'}")
+            tc.configure_args.append(f"--enable-match-finders={','.join(self._match_finders)}")
+            if self.options.small:
+                tc.configure_args.append("--enable-small")
             tc.generate()
 
     @property
@@ -104,6 +147,28 @@ class XZUtilsConan(ConanFile):
             return "vs2017"
         return "vs2013"
 
+    def _patch_msvc_features(self, build_script_folder, vcxproj_files):
+        # The MSBuild solution has no configure step: features are set in a hand-written config.h,
+        # and some of them also change the list of sources to compile
+        config_h = os.path.join(build_script_folder, "config.h")
+        removed_sources = []
+        if not self.options.threads:
+            replace_in_file(self, config_h, "#define MYTHREAD_VISTA 1", "")
+            removed_sources.extend(["stream_encoder_mt.c", "stream_decoder_mt.c", "outqueue.c"])
+        for mf in self._all_match_finders:
+            if mf not in self._match_finders:
+                replace_in_file(self, config_h, f"#define HAVE_MF_{mf.upper()} 1", "")
+        if self.options.small:
+            save(self, config_h, "\n#define HAVE_SMALL 1\n", append=True)
+            removed_sources.extend(["crc32_table.c", "crc64_table.c"])
+        for vcxproj_file in vcxproj_files:
+            content = load(self, vcxproj_file)
+            for source in removed_sources:
+                content = re.sub(rf"\s*<ClCompile Include=\"[^\"]*\\{re.escape(source)}\" />", "", content)
+            if self.options.small:
+                content = content.replace("crc32_fast.c", "crc32_small.c").replace("crc64_fast.c", "crc64_small.c")
+            save(self, vcxproj_file, content)
+
     def _build_msvc(self):
         build_script_folder = os.path.join(self.source_folder, "windows", self._msvc_sln_folder)
 
@@ -134,7 +199,9 @@ class XZUtilsConan(ConanFile):
             
             if self.settings.arch == "armv8":
                 replace_in_file(self, vcxproj_file, "x64", "ARM64")
-            
+
+        self._patch_msvc_features(build_script_folder, vcxproj_files)
+
         solution_file = os.path.join(build_script_folder, "xz_win.sln")
         if self.settings.arch == "armv8":
             replace_in_file(self, solution_file, "x64", "ARM64")
@@ -207,7 +274,7 @@ class XZUtilsConan(ConanFile):
         self.cpp_info.libs = ["lzma"]
         if not self.options.shared:
             self.cpp_info.defines.append("LZMA_API_STATIC")
-        if self.settings.os in ["Linux", "FreeBSD"]:
+        if self.settings.os in ["Linux", "FreeBSD"] and self.options.threads:
             self.cpp_info.system_libs.append("pthread")
 
         # TODO: to remove in conan v2 once cmake_find_package* & pkg_config generators removed
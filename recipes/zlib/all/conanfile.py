@@ -1,6 +1,8 @@
 from conan import ConanFile
+from conan.tools.apple import fix_apple_shared_install_name
 from conan.tools.cmake import CMake, CMakeToolchain, cmake_layout
-from conan.tools.files import apply_conandata_patches, export_conandata_patches, get, load, replace_in_file, save
+from conan.tools.files import apply_conandata_patches, copy, export_conandata_patches, get, load, replace_in_file, rmdir, save
+from conan.tools.microsoft import is_msvc
 from conan.tools.scm import Version
 import os
 
@@ -21,16 +23,26 @@ class ZlibConan(ConanFile):
     options = {
         "shared": [True, False],
         "fPIC": [True, False],
+        "backend": ["zlib", "zlib-ng"],
     }
     default_options = {
         "shared": False,
         "fPIC": True,
+        "backend": "zlib",
+    }
+    options_description = {
+        "backend": ("Implementation of the zlib API. zlib-ng is built in compat mode from sources "
+                    "bundled with this recipe, which are downloaded by every build (see source())"),
     }
 
     @property
     def _is_mingw(self):
         return self.settings.os == "Windows" and self.settings.compiler == "gcc"
 
+    @property
+    def _zlib_ng_source_folder(self):
+        return os.path.join(self.source_folder, "zlib-ng")
+
     def export_sources(self):
         export_conandata_patches(self)
 
@@ -48,19 +60,38 @@ class ZlibConan(ConanFile):
         cmake_layout(self, src_folder="src")
 
     def source(self):
+        # Options are not available in source(), so the sources of both backends are fetched,
+        # and every zlib build, including the default backend=zlib, also downloads the zlib-ng
+        # tarball. zlib-ng can not be consumed as a requirement instead: in compat mode
+        # the zlib-ng recipe provides "zlib", which conflicts with this package in the graph
         get(self, **self.conan_data["sources"][self.version],
             destination=self.source_folder, strip_root=True)
+        get(self, **self.conan_data["zlib_ng_sources"][self.version],
+            destination=self._zlib_ng_source_folder, strip_root=True)
 
     def generate(self):
         tc = CMakeToolchain(self)
-        tc.variables["SKIP_INSTALL_ALL"] = False
-        tc.variables["SKIP_INSTALL_LIBRARIES"] = False
-        tc.variables["SKIP_INSTALL_HEADERS"] = False
-        tc.variables["SKIP_INSTALL_FILES"] = True
-        # Correct for misuse of "${CMAKE_INSTALL_PREFIX}/" in CMakeLists.txt
-        tc.variables["INSTALL_LIB_DIR"] = "lib"
-        tc.variables["INSTALL_INC_DIR"] = "include"
-        tc.variables["ZLIB_BUILD_EXAMPLES"] = False
+        if self.options.backend == "zlib-ng":
+            # zlib-ng in compat mode is a drop-in replacement of zlib, with SIMD
+            # accelerated deflate/inflate selected at runtime
+            tc.variables["ZLIB_COMPAT"] = True
+            tc.variables["ZLIB_ENABLE_TESTS"] = False
+            tc.variables["ZLIBNG_ENABLE_TESTS"] = False
+            tc.variables["WITH_GTEST"] = False
+            tc.variables["WITH_GZFILEOP"] = True
+            tc.variables["WITH_OPTIM"] = True
+            tc.variables["WITH_NEW_STRATEGIES"] = True
+            tc.variables["WITH_NATIVE_INSTRUCTIONS"] = False
+            tc.variables["WITH_RUNTIME_CPU_DETECTION"] = True
+        else:
+            tc.variables["SKIP_INSTALL_ALL"] = False
+            tc.variables["SKIP_INSTALL_LIBRARIES"] = False
+            tc.variables["SKIP_INSTALL_HEADERS"] = False
+            tc.variables["SKIP_INSTALL_FILES"] = True
+            # Correct for misuse of "${CMAKE_INSTALL_PREFIX}/" in CMakeLists.txt
+            tc.variables["INSTALL_LIB_DIR"] = "lib"
+            tc.variables["INSTALL_INC_DIR"] = "include"
+            tc.variables["ZLIB_BUILD_EXAMPLES"] = False
         tc.generate()
 
     def _patch_sources(self):
@@ -80,6 +111,11 @@ class ZlibConan(ConanFile):
                                       '#if defined(HAVE_STDARG_H) && (1-HAVE_STDARG_H-1 != 0)')
 
     def build(self):
+        if self.options.backend == "zlib-ng":
+            cmake = CMake(self)
+            cmake.configure(build_script_folder=self._zlib_ng_source_folder)
+            cmake.build()
+            return
         self._patch_sources()
         cmake = CMake(self)
         cmake.configure()
@@ -91,6 +127,14 @@ class ZlibConan(ConanFile):
         return license_contents
 
     def package(self):
+        if self.options.backend == "zlib-ng":
+            copy(self, "LICENSE.md", src=self._zlib_ng_source_folder, dst=os.path.join(self.package_folder, "licenses"))
+            cmake = CMake(self)
+            cmake.install()
+            rmdir(self, os.path.join(self.package_folder, "lib", "pkgconfig"))
+            rmdir(self, os.path.join(self.package_folder, "lib", "cmake"))
+            fix_apple_shared_install_name(self)
+            return
         save(self, os.path.join(self.package_folder, "licenses", "LICENSE"), self._extract_license())
         cmake = CMake(self)
         cmake.install()
@@ -100,7 +144,17 @@ class ZlibConan(ConanFile):
         self.cpp_info.set_property("cmake_file_name", "ZLIB")
         self.cpp_info.set_property("cmake_target_name", "ZLIB::ZLIB")
         self.cpp_info.set_property("pkg_config_name", "zlib")
-        if self.settings.os == "Windows" and not self._is_mingw:
+        if self.options.backend == "zlib-ng":
+            # Same naming logic as recipes/zlib-ng for zlib-ng>=2.0.4 in compat mode
+            if self.settings.os == "Windows":
+                base = "zlib" if is_msvc(self) or self.options.shared else "z"
+                static_flag = "static" if is_msvc(self) and not self.options.shared else ""
+                build_type = "d" if self.settings.build_type == "Debug" else ""
+                libname = f"{base}{static_flag}{build_type}"
+            else:
+                libname = "z"
+            self.cpp_info.defines = ["ZLIB_COMPAT", "WITH_GZFILEOP"]
+        elif self.settings.os == "Windows" and not self._is_mingw:
             libname = "zdll" if self.options.shared else "zlib"
         else:
             libname = "z"
@@ -1,12 +1,86 @@
 #include <stdlib.h>
 #include <stdio.h>
 #include <string.h>
+#include <time.h>
 
 #include <zlib.h>
 
+#define CORPUS_SIZE (2 * 1024 * 1024)
+
+/* Build a compressible text corpus: pseudo-random sequence of words */
+static void fill_corpus(unsigned char *corpus, size_t size) {
+    static const char *words[] = {
+        "conan", "package", "manager", "compression", "deflate", "inflate",
+        "recipe", "binary", "zlib", "stream", "the", "of", "and", "to",
+    };
+    const size_t nwords = sizeof(words) / sizeof(words[0]);
+    unsigned long seed = 12345;
+    size_t pos = 0;
+    while (pos < size) {
+        const char *word;
+        size_t len;
+        seed = seed * 1103515245UL + 12345UL;
+        word = words[(seed >> 16) % nwords];
+        len = strlen(word);
+        if (pos + len + 1 > size) {
+            break;
+        }
+        memcpy(corpus + pos, word, len);
+        pos += len;
+        corpus[pos++] = ' ';
+    }
+    memset(corpus + pos, ' ', size - pos);
+}
+
+static int benchmark(const unsigned char *corpus, uLong size, int level) {
+    uLongf compressed_size = compressBound(size);
+    uLongf decompressed_size = size;
+    unsigned char *compressed = (unsigned char *) malloc(compressed_size);
+    unsigned char *decompressed = (unsigned char *) malloc(size);
+    clock_t start, end;
+    double compress_time, decompress_time;
+    int ret = EXIT_FAILURE;
+
+    if (compressed == NULL || decompressed == NULL) {
+        goto cleanup;
+    }
+
+    start = clock();
+    if (compress2(compressed, &compressed_size, corpus, size, level) != Z_OK) {
+        goto cleanup;
+    }
+    end = clock();
+    compress_time = (double) (end - start) / CLOCKS_PER_SEC;
+
+    start = clock();
+    if (uncompress(decompressed, &decompressed_size, compressed, compressed_size) != Z_OK) {
+        goto cleanup;
+    }
+    end = clock();
+    decompress_time = (double) (end - start) / CLOCKS_PER_SEC;
+
+    if (decompressed_size != size || memcmp(corpus, decompressed, size) != 0) {
+        goto cleanup;
+    }
+
+    printf("level %d: ratio %.2f, compress %.1f MB/s, decompress %.1f MB/s\n",
+           level, (double) size / compressed_size,
+           compress_time > 0 ? size / compress_time / 1e6 : 0.0,
+           decompress_time > 0 ? size / decompress_time / 1e6 : 0.0);
+    ret = EXIT_SUCCESS;
+
+cleanup:
+    free(compressed);
+    free(decompressed);
+    return ret;
+}
+
 int main(void) {
     char buffer_in [32] = {"Conan Package Manager"};
     char buffer_out [32] = {0};
+    static const int levels[] = {1, 6, 9};
+    unsigned char *corpus;
+    size_t i;
 
     z_stream defstream;
     defstream.zalloc = Z_NULL;
@@ -28,5 +102,19 @@ int main(void) {
 
     printf("ZLIB VERSION: %s\n", zlibVersion());
 
+    /* Run with each value of the "backend" option to compare throughput */
+    corpus = (unsigned char *) malloc(CORPUS_SIZE);
+    if (corpus == NULL) {
+        return EXIT_FAILURE;
+    }
+    fill_corpus(corpus, CORPUS_SIZE);
+    for (i = 0; i < sizeof(levels) / sizeof(levels[0]); ++i) {
+        if (benchmark(corpus, CORPUS_SIZE, levels[i]) != EXIT_SUCCESS) {
+            free(corpus);
+            return EXIT_FAILURE;
+        }
+    }
+    free(corpus);
+
     return EXIT_SUCCESS;
 }